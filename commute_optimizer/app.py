@@ -192,6 +192,11 @@ class CommuteOptimizerApp:
         current_conditions: Dict[str, Any]
     ) -> List[RouteAnalysis]:
         """Analyze all routes for time, cost, stress, and reliability."""
+        try:
+            return self.route_analysis.analyze_routes(routes, current_conditions)
+        except Exception as e:
+            self.logger.warning(f"Error analyzing routes as a batch, retrying one at a time: {str(e)}")
+        
         analyses = []
         
         for route in routes:
@@ -241,8 +246,10 @@ class CommuteOptimizerApp:
     ) -> Dict[str, Any]:
         """Generate contextual recommendation with explanation."""
         try:
-            # Rank routes based on preferences
-            ranked_routes = self.decision_engine.rank_routes(routes, analyses, preference_profile)
+            # Rank routes based on preferences (the recommendation uses the top 3)
+            ranked_routes = self.decision_engine.rank_routes(
+                routes, analyses, preference_profile, top_k=3
+            )
             
             # Generate recommendation with reasoning
             recommendation = self.decision_engine.generate_recommendation(
@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     # Application Configuration
     max_routes_per_request: int = 3
     cache_ttl_minutes: int = 5
+    max_cache_entries_per_source: int = 250
     default_max_walking_distance: float = 2.0
     
     # Testing Configuration
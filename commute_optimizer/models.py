@@ -2,7 +2,8 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -65,8 +66,9 @@ class PreferenceProfile(BaseModel):
     comfort_weight: int = Field(..., ge=0, le=100, description="Weight for comfort priority (0-100)")
     reliability_weight: int = Field(..., ge=0, le=100, description="Weight for reliability priority (0-100)")
     max_walking_distance: float = Field(default=2.0, gt=0, description="Maximum walking distance in kilometers")
-    preferred_modes: List[TransportationMode] = Field(default_factory=list)
-    avoided_features: List[str] = Field(default_factory=list, description="Features to avoid (highways, tolls, etc.)")
+    # Read-only tuples so adjusted profiles and route requests can share them without copying
+    preferred_modes: Tuple[TransportationMode, ...] = Field(default_factory=tuple)
+    avoided_features: Tuple[str, ...] = Field(default_factory=tuple, description="Features to avoid (highways, tolls, etc.)")
 
     @field_validator('reliability_weight')
     @classmethod
@@ -172,4 +174,14 @@ class RouteAnalysis(BaseModel):
     cost_analysis: CostAnalysis
     stress_analysis: StressAnalysis
     reliability_analysis: ReliabilityAnalysis
-    tradeoff_summary: TradeoffSummary
\ No newline at end of file
+    tradeoff_summary: TradeoffSummary
+
+    @cached_property
+    def metrics(self) -> Tuple[int, float, int, int]:
+        """(time, cost, stress, reliability) headline metrics, cached on first access."""
+        return (
+            self.time_analysis.estimated_time,
+            self.cost_analysis.total_cost,
+            self.stress_analysis.overall_stress,
+            self.reliability_analysis.overall_reliability
+        )
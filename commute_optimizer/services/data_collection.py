@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
@@ -20,7 +21,7 @@ class DataSource(str, Enum):
     PARKING = "parking"
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedData:
     """Cached data with timestamp and freshness tracking."""
     data: Dict[str, Any]
@@ -89,7 +90,9 @@ class DataCollectionService:
     
     def __init__(self):
         """Initialize the data collection service."""
-        self.cache: Dict[str, CachedData] = {}
+        # Insertion/access ordered so the least recently used entries are evicted first
+        self.cache: "OrderedDict[str, CachedData]" = OrderedDict()
+        self.max_entries_per_source = settings.max_cache_entries_per_source
         self.logger = logging.getLogger(__name__)
         
         # Data refresh intervals (minutes)
@@ -134,7 +137,9 @@ class DataCollectionService:
         if not force_refresh and cache_key in self.cache:
             cached = self.cache[cache_key]
             if cached.is_fresh:
-                self.logger.debug(f"Using cached traffic data (age: {cached.age_minutes:.1f}min)")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Using cached traffic data (age: %.1fmin)", cached.age_minutes)
+                self.cache.move_to_end(cache_key)
                 return self._dict_to_traffic_data(cached.data)
         
         # Collect fresh data
@@ -147,7 +152,7 @@ class DataCollectionService:
             # Cache the data
             self._cache_data(cache_key, asdict(traffic_data), DataSource.TRAFFIC, location_key)
             
-            self.logger.info(f"Collected fresh traffic data for {location_key}")
+            self.logger.info("Collected fresh traffic data for %s", location_key)
             return traffic_data
             
         except Exception as e:
@@ -186,7 +191,9 @@ class DataCollectionService:
         if not force_refresh and cache_key in self.cache:
             cached = self.cache[cache_key]
             if cached.is_fresh:
-                self.logger.debug(f"Using cached transit data (age: {cached.age_minutes:.1f}min)")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Using cached transit data (age: %.1fmin)", cached.age_minutes)
+                self.cache.move_to_end(cache_key)
                 return self._dict_to_transit_data(cached.data)
         
         # Collect fresh data
@@ -199,7 +206,7 @@ class DataCollectionService:
             # Cache the data
             self._cache_data(cache_key, asdict(transit_data), DataSource.TRANSIT, location_key)
             
-            self.logger.info(f"Collected fresh transit data for {location_key}")
+            self.logger.info("Collected fresh transit data for %s", location_key)
             return transit_data
             
         except Exception as e:
@@ -236,7 +243,9 @@ class DataCollectionService:
         if not force_refresh and cache_key in self.cache:
             cached = self.cache[cache_key]
             if cached.is_fresh:
-                self.logger.debug(f"Using cached weather data (age: {cached.age_minutes:.1f}min)")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Using cached weather data (age: %.1fmin)", cached.age_minutes)
+                self.cache.move_to_end(cache_key)
                 return self._dict_to_weather_data(cached.data)
         
         # Collect fresh data
@@ -249,7 +258,7 @@ class DataCollectionService:
             # Cache the data with longer TTL for weather
             self._cache_data(cache_key, asdict(weather_data), DataSource.WEATHER, location_key, ttl_minutes=15)
             
-            self.logger.info(f"Collected fresh weather data for {location_key}")
+            self.logger.info("Collected fresh weather data for %s", location_key)
             return weather_data
             
         except Exception as e:
@@ -286,7 +295,9 @@ class DataCollectionService:
         if not force_refresh and cache_key in self.cache:
             cached = self.cache[cache_key]
             if cached.is_fresh:
-                self.logger.debug(f"Using cached parking data (age: {cached.age_minutes:.1f}min)")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Using cached parking data (age: %.1fmin)", cached.age_minutes)
+                self.cache.move_to_end(cache_key)
                 return self._dict_to_parking_data(cached.data)
         
         # Collect fresh data
@@ -299,7 +310,7 @@ class DataCollectionService:
             # Cache the data
             self._cache_data(cache_key, asdict(parking_data), DataSource.PARKING, location_key, ttl_minutes=10)
             
-            self.logger.info(f"Collected fresh parking data for {location_key}")
+            self.logger.info("Collected fresh parking data for %s", location_key)
             return parking_data
             
         except Exception as e:
@@ -420,7 +431,8 @@ class DataCollectionService:
     
     def _generate_location_key(self, origin: Location, destination: Location) -> str:
         """Generate a cache key for origin-destination pair."""
-        return f"{origin.latitude:.3f},{origin.longitude:.3f}-{destination.latitude:.3f},{destination.longitude:.3f}"
+        # '|' separates the two endpoints; '-' would clash with negative coordinates
+        return f"{origin.latitude:.3f},{origin.longitude:.3f}|{destination.latitude:.3f},{destination.longitude:.3f}"
     
     def _cache_data(
         self, 
@@ -441,6 +453,30 @@ class DataCollectionService:
             location_key=location_key,
             ttl_minutes=ttl_minutes
         )
+        self.cache.move_to_end(cache_key)
+        self._evict_least_recently_used(source)
+    
+    @staticmethod
+    def _cached_fields(cached_data: CachedData) -> Dict[str, Any]:
+        """Copy of a cached entry's data without its last_updated timestamp."""
+        data = dict(cached_data.data)
+        data.pop('last_updated', None)
+        return data
+    
+    def _evict_least_recently_used(self, source: DataSource) -> None:
+        """
+        Keep each data source within its cache size limit.
+        
+        Limits are applied per source so a flood of route lookups cannot
+        evict the (far fewer) weather and parking entries.
+        """
+        if len(self.cache) <= self.max_entries_per_source:
+            return
+        
+        source_keys = [key for key, cached in self.cache.items() if cached.source == source]
+        excess = len(source_keys) - self.max_entries_per_source
+        for key in source_keys[:max(0, excess)]:
+            del self.cache[key]
     
     # Mock API implementations (for testing and development)
     async def _mock_traffic_api(self, origin: Location, destination: Location) -> TrafficData:
@@ -698,15 +734,10 @@ class DataCollectionService:
             location_key = self._generate_location_key(origin, destination)
             cache_key = f"traffic_{location_key}"
             
-            if cache_key in self.cache and self.cache[cache_key].is_fresh:
-                cached_data = self.cache[cache_key]
-                return {
-                    'congestion_level': cached_data.data['congestion_level'],
-                    'pattern': cached_data.data['pattern'],
-                    'active_incidents': cached_data.data['active_incidents'],
-                    'average_speed_kmh': cached_data.data['average_speed_kmh'],
-                    'delay_minutes': cached_data.data['delay_minutes']
-                }
+            cached_data = self.cache.get(cache_key)
+            if cached_data is not None and cached_data.is_fresh:
+                self.cache.move_to_end(cache_key)
+                return self._cached_fields(cached_data)
         
         # Return default data
         traffic_data = self._get_default_traffic_data()
@@ -727,15 +758,10 @@ class DataCollectionService:
             location_key = f"{location.latitude:.3f},{location.longitude:.3f}"
             cache_key = f"weather_{location_key}"
             
-            if cache_key in self.cache and self.cache[cache_key].is_fresh:
-                cached_data = self.cache[cache_key]
-                return {
-                    'condition': cached_data.data['condition'],
-                    'temperature': cached_data.data['temperature'],
-                    'visibility_km': cached_data.data['visibility_km'],
-                    'wind_speed_kmh': cached_data.data['wind_speed_kmh'],
-                    'precipitation_probability': cached_data.data['precipitation_probability']
-                }
+            cached_data = self.cache.get(cache_key)
+            if cached_data is not None and cached_data.is_fresh:
+                self.cache.move_to_end(cache_key)
+                return self._cached_fields(cached_data)
         
         # Return default data
         weather_data = self._get_default_weather_data()
@@ -756,15 +782,10 @@ class DataCollectionService:
             location_key = self._generate_location_key(origin, destination)
             cache_key = f"transit_{location_key}"
             
-            if cache_key in self.cache and self.cache[cache_key].is_fresh:
-                cached_data = self.cache[cache_key]
-                return {
-                    'service_status': cached_data.data['service_status'],
-                    'delay_minutes': cached_data.data['delay_minutes'],
-                    'next_departure': cached_data.data['next_departure'],
-                    'service_frequency_minutes': cached_data.data['service_frequency_minutes'],
-                    'route_disruptions': cached_data.data['route_disruptions']
-                }
+            cached_data = self.cache.get(cache_key)
+            if cached_data is not None and cached_data.is_fresh:
+                self.cache.move_to_end(cache_key)
+                return self._cached_fields(cached_data)
         
         # Return default data
         transit_data = self._get_default_transit_data()
@@ -877,9 +898,9 @@ class RealTimeDataManager:
         
         # Log status
         if critical_entries:
-            self.logger.warning(f"Found {len(critical_entries)} critical stale data entries")
+            self.logger.warning("Found %d critical stale data entries", len(critical_entries))
         if stale_entries:
-            self.logger.info(f"Found {len(stale_entries)} stale data entries")
+            self.logger.info("Found %d stale data entries", len(stale_entries))
         
         # Update critical entries first (high priority)
         for cache_key, cached_data, age in critical_entries:
@@ -914,10 +935,10 @@ class RealTimeDataManager:
             elif cache_key.startswith("parking_"):
                 await self._refresh_parking_data(cache_key, cached_data.location_key)
             
-            self.logger.debug(f"Refreshed {priority} priority data: {cache_key}")
+            self.logger.debug("Refreshed %s priority data: %s", priority, cache_key)
             
         except Exception as e:
-            self.logger.error(f"Failed to refresh cached data {cache_key}: {e}")
+            self.logger.error("Failed to refresh cached data %s: %s", cache_key, e)
     
     async def _refresh_traffic_data(self, cache_key: str, location_key: str) -> None:
         """Refresh traffic data for a specific location."""
@@ -952,13 +973,15 @@ class RealTimeDataManager:
         Parse location key to extract origin and destination.
         
         Args:
-            location_key: Location key in format "lat1,lon1-lat2,lon2"
+            location_key: Location key in format "lat1,lon1|lat2,lon2"
             
         Returns:
             Tuple of (origin, destination) or (None, None) if parsing fails
         """
         try:
-            origin_str, destination_str = location_key.split('-')
+            origin_str, separator, destination_str = location_key.partition('|')
+            if not separator:
+                raise ValueError("missing '|' separator")
             
             origin_lat, origin_lon = map(float, origin_str.split(','))
             dest_lat, dest_lon = map(float, destination_str.split(','))
@@ -978,7 +1001,7 @@ class RealTimeDataManager:
             return origin, destination
             
         except (ValueError, IndexError) as e:
-            self.logger.error(f"Failed to parse location key '{location_key}': {e}")
+            self.logger.error("Failed to parse location key '%s': %s", location_key, e)
             return None, None
     
     def _parse_single_location_key(self, location_key: str) -> Optional[Location]:
@@ -1001,7 +1024,7 @@ class RealTimeDataManager:
             )
             
         except (ValueError, IndexError) as e:
-            self.logger.error(f"Failed to parse single location key '{location_key}': {e}")
+            self.logger.error("Failed to parse single location key '%s': %s", location_key, e)
             return None
     
     def get_data_freshness_status(self) -> Dict[str, Any]:
@@ -1021,40 +1044,43 @@ class RealTimeDataManager:
                 'stale': 0,
                 'critical': 0
             },
-            'by_source': {},
+            'by_source': {
+                data_source.value: {'fresh': 0, 'stale': 0, 'critical': 0, 'total': 0}
+                for data_source in DataSource
+            },
             'entries': []
         }
         
+        # Thresholds are invariant per source, so resolve them once up front
+        thresholds = {
+            data_source: (
+                self.freshness_thresholds.get(data_source, 10),
+                self.critical_thresholds.get(data_source, 20)
+            )
+            for data_source in DataSource
+        }
+        freshness_summary = status['freshness_summary']
+        by_source = status['by_source']
+        
         # Analyze each cached entry
         for cache_key, cached_data in self.data_service.cache.items():
             age_minutes = cached_data.age_minutes
             source = cached_data.source.value
-            
-            freshness_threshold = self.freshness_thresholds.get(cached_data.source, 10)
-            critical_threshold = self.critical_thresholds.get(cached_data.source, 20)
+            freshness_threshold, critical_threshold = thresholds[cached_data.source]
             
             # Determine freshness status
             if age_minutes > critical_threshold:
                 freshness_status = 'critical'
-                status['freshness_summary']['critical'] += 1
             elif age_minutes > freshness_threshold:
                 freshness_status = 'stale'
-                status['freshness_summary']['stale'] += 1
             else:
                 freshness_status = 'fresh'
-                status['freshness_summary']['fresh'] += 1
+            freshness_summary[freshness_status] += 1
             
             # Update by-source statistics
-            if source not in status['by_source']:
-                status['by_source'][source] = {
-                    'fresh': 0,
-                    'stale': 0,
-                    'critical': 0,
-                    'total': 0
-                }
-            
-            status['by_source'][source][freshness_status] += 1
-            status['by_source'][source]['total'] += 1
+            source_status = by_source[source]
+            source_status[freshness_status] += 1
+            source_status['total'] += 1
             
             # Add entry details
             status['entries'].append({
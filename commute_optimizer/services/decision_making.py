@@ -1,14 +1,285 @@
 """Decision Making Engine for route ranking and recommendation generation."""
 
+import heapq
+import operator
+import re
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import cached_property, lru_cache, partial
+from types import MappingProxyType
 
 from commute_optimizer.models import (
     Route, RouteAnalysis, PreferenceProfile, UserPreferences,
-    TradeoffSummary, ComparisonPoint
+    TradeoffSummary, ComparisonPoint, TransportationMode
 )
 
 
+# Shared read-only stand-in for missing context sections
+_EMPTY = MappingProxyType({})
+
+# Context values that trigger weather and traffic reasoning
+_BAD_WEATHER_CONDITIONS = frozenset({'rain', 'snow'})
+_WEATHER_SAFE_MODES = frozenset({'public_transit', 'driving'})
+_HEAVY_CONGESTION_LEVELS = frozenset({'heavy', 'severe'})
+
+# Sort key for (route, analysis, score) ranking entries
+_SCORE_KEY = operator.itemgetter(2)
+
+
+@lru_cache(maxsize=4096)
+def _normalized_scores(
+    time: float,
+    cost: float,
+    stress: float,
+    reliability: float
+) -> Tuple[float, float, float, float]:
+    """
+    Normalize one route's metrics to 0-1 (time, cost, comfort, reliability) scores.
+    
+    Higher is better: 120 min and $20 map to 0, and the 1-10 stress and
+    reliability scales map onto 0-1.
+    """
+    return (
+        max(0, 1 - (time / 120)),
+        max(0, 1 - (cost / 20)),
+        (10 - stress) / 9,
+        (reliability - 1) / 9
+    )
+
+
+@lru_cache(maxsize=4096)
+def _weighted_score(
+    time: float,
+    cost: float,
+    stress: float,
+    reliability: float,
+    time_weight: int,
+    cost_weight: int,
+    comfort_weight: int,
+    reliability_weight: int
+) -> float:
+    """
+    Weighted 0-1 score for one route's metrics and percentage preference weights.
+    
+    Memoized because the same route/preference pairs are rescored across the
+    ranking, what-if and transparency calls of a single request.
+    
+    Each normalized score is already within 0-1 and the weights must sum to 100
+    (PreferenceProfile enforces that), so the result needs no clamping.
+    """
+    time_score, cost_score, comfort_score, reliability_score = _normalized_scores(
+        time, cost, stress, reliability
+    )
+    weighted_score = (
+        (time_score * time_weight / 100) +
+        (cost_score * cost_weight / 100) +
+        (comfort_score * comfort_weight / 100) +
+        (reliability_score * reliability_weight / 100)
+    )
+    if __debug__:
+        assert 0.0 <= weighted_score <= 1.0 + 1e-9, weighted_score
+    return weighted_score
+
+
+# Breakdown criteria in metric order
+_BREAKDOWN_CRITERIA = ("time", "cost", "comfort", "reliability")
+
+
+@dataclass(frozen=True)
+class _CriterionStats:
+    """One criterion summarized over every route except the one being described."""
+    minimum: float
+    maximum: float
+    mean: float
+    min_index: int
+    max_index: int
+
+
+# Phrasings of each forbidden claim that need their criteria explained nearby
+_FORBIDDEN_TERMS = MappingProxyType({
+    "best": ("best route", "best option", "best choice", "the best"),
+    "optimal": ("optimal route", "optimal choice", "optimal solution", "the optimal"),
+    "perfect": ("perfect route", "perfect choice", "perfect option", "the perfect"),
+    "ideal": ("ideal route", "ideal choice", "ideal option", "the ideal"),
+    "recommended": ("recommended route", "recommended option", "is recommended"),
+    "should": ("you should take", "you should choose"),
+    "must": ("you must take", "you must choose")
+})
+_FORBIDDEN_VARIATIONS = tuple(
+    variation for variations in _FORBIDDEN_TERMS.values() for variation in variations
+)
+
+# Superlative claims that need an explanation or comparison nearby
+_SUPERLATIVE_TERMS = (
+    "fastest", "slowest", "cheapest", "most expensive",
+    "most reliable", "least reliable", "most stressful", "least stressful",
+    "highest", "lowest", "maximum", "minimum",
+    "always", "never", "guaranteed", "certain"
+)
+
+# The route-comparison superlatives that filter_and_correct_language explains
+_CORRECTABLE_SUPERLATIVES = frozenset(_SUPERLATIVE_TERMS[:8])
+
+# Qualifier appended to each correctable superlative
+_SUPERLATIVE_EXPLANATIONS = MappingProxyType({
+    "fastest": "compared to other available routes",
+    "slowest": "among the route options",
+    "cheapest": "of the available alternatives",
+    "most expensive": "compared to other routes",
+    "most reliable": "based on historical data",
+    "least reliable": "according to timing variance",
+    "most stressful": "due to traffic and complexity factors",
+    "least stressful": "with minimal traffic exposure"
+})
+
+# Wording worth reviewing, with a suggested alternative
+_LANGUAGE_WARNING_TERMS = MappingProxyType({
+    "obviously": "May sound condescending - consider removing",
+    "clearly": "May sound condescending - consider 'this shows' instead",
+    "definitely": "Consider 'likely' or 'typically' for more accurate language",
+    "absolutely": "Consider more nuanced language",
+    "impossible": "Consider 'very difficult' or 'not recommended'",
+    "terrible": "Consider more specific, constructive language",
+    "awful": "Consider more specific, constructive language",
+    "horrible": "Consider more specific, constructive language"
+})
+
+# Advice appended whenever any language violation is found
+_GENERAL_LANGUAGE_SUGGESTIONS = (
+    "Focus on explaining the reasoning behind claims rather than making absolute statements",
+    "Provide context and criteria for any comparative or superlative statements"
+)
+
+_EXPLANATION_KEYWORDS = (
+    "because", "since", "due to", "based on", "given that",
+    "considering", "factors", "criteria", "reasons", "analysis"
+)
+
+_COMPARISON_KEYWORDS = (
+    "compared to", "versus", "than", "relative to",
+    "among", "between", "of all", "in comparison"
+)
+
+# Superlatives pass with either kind of context nearby
+_EXPLANATION_OR_COMPARISON_KEYWORDS = _EXPLANATION_KEYWORDS + _COMPARISON_KEYWORDS
+
+# Distinct texts remembered by each language check
+_LANGUAGE_CACHE_SIZE = 1024
+
+
+def _keyword_near(
+    text_lower: str,
+    term_pos: int,
+    term_length: int,
+    keywords: Tuple[str, ...]
+) -> bool:
+    """
+    Check whether any keyword appears within 50 characters of a term at term_pos.
+    
+    Takes the already-lowercased text, so the window is a plain slice of it
+    rather than a second lowercasing of the original.
+    """
+    start_pos = max(0, term_pos - 50)
+    end_pos = min(len(text_lower), term_pos + term_length + 50)
+    surrounding_text = text_lower[start_pos:end_pos]
+    
+    return any(keyword in surrounding_text for keyword in keywords)
+
+
+@lru_cache(maxsize=_LANGUAGE_CACHE_SIZE)
+def _has_nearby_keyword(text: str, term: str, keywords: Tuple[str, ...]) -> bool:
+    """Check whether any keyword appears within 50 characters of the term's first use."""
+    text_lower = text.lower()
+    term_pos = text_lower.find(term.lower())
+    return term_pos != -1 and _keyword_near(text_lower, term_pos, len(term), keywords)
+
+
+def _unexplained_terms(
+    text_lower: str,
+    terms: Tuple[str, ...],
+    keywords: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """
+    Lowercase terms used in the lowered text without any of the keywords nearby.
+    
+    Each term is located with a single find on the pre-lowered text, whose
+    position is reused for the nearby-keyword check instead of searching for
+    the term again.
+    """
+    unexplained = []
+    for term in terms:
+        term_pos = text_lower.find(term)
+        if term_pos != -1 and not _keyword_near(text_lower, term_pos, len(term), keywords):
+            unexplained.append(term)
+    return tuple(unexplained)
+
+
+@dataclass(frozen=True)
+class _LanguageFindings:
+    """Terms one text uses that the language-compliance checks care about."""
+    forbidden_terms: Tuple[str, ...]
+    superlatives: Tuple[str, ...]
+    warning_terms: Tuple[str, ...]
+
+
+# What _scan_language reports for fully compliant text
+_NO_LANGUAGE_FINDINGS = _LanguageFindings(forbidden_terms=(), superlatives=(), warning_terms=())
+
+
+@lru_cache(maxsize=_LANGUAGE_CACHE_SIZE)
+def _scan_language(text: str) -> _LanguageFindings:
+    """Run every language-compliance scan over one lowercased copy of the text."""
+    text_lower = text.lower()
+    return _LanguageFindings(
+        forbidden_terms=_unexplained_terms(
+            text_lower, _FORBIDDEN_VARIATIONS, _EXPLANATION_KEYWORDS
+        ),
+        superlatives=_unexplained_terms(
+            text_lower, _SUPERLATIVE_TERMS, _EXPLANATION_OR_COMPARISON_KEYWORDS
+        ),
+        warning_terms=tuple(term for term in _LANGUAGE_WARNING_TERMS if term in text_lower)
+    )
+
+
+# Contextual replacements for forbidden terms; module-level (and bound with
+# functools.partial) so an engine holding them can still be pickled
+def _best_in_context(engine: "DecisionMakingEngine", context: Dict[str, Any]) -> str:
+    """"best" -> highest-scoring for the user's top priority."""
+    return f"highest-scoring for {engine._get_preference_context(context)}"
+
+
+def _optimal_in_context(engine: "DecisionMakingEngine", context: Dict[str, Any]) -> str:
+    """"optimal" -> most suitable given the route's strong points."""
+    return f"most suitable given {engine._get_analysis_context(context)}"
+
+
+def _perfect_in_context(engine: "DecisionMakingEngine", context: Dict[str, Any]) -> str:
+    """"perfect" -> well-suited, which needs no context."""
+    return "well-suited for your stated priorities"
+
+
+def _recommended_in_context(engine: "DecisionMakingEngine", context: Dict[str, Any]) -> str:
+    """"recommended" -> suggested, with the reasoning behind it."""
+    return f"suggested because {engine._get_reasoning_context(context)}"
+
+
+@lru_cache(maxsize=256)
+def _term_pattern(term: str, whole_word: bool = False) -> re.Pattern:
+    """Case-insensitive pattern for a literal term, optionally matched as a whole word."""
+    pattern = re.escape(term)
+    if whole_word:
+        pattern = f"\\b{pattern}\\b"
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def clear_language_caches() -> None:
+    """Forget every memoized language-compliance result and compiled term pattern."""
+    _has_nearby_keyword.cache_clear()
+    _scan_language.cache_clear()
+    _term_pattern.cache_clear()
+
+
 class DecisionMakingEngine:
     """
     Engine for applying user preferences to route analysis and providing transparent recommendations.
@@ -17,6 +288,62 @@ class DecisionMakingEngine:
     into user-centric recommendations with clear explanations and trade-off analysis.
     """
     
+    # (metric getter, comparison, threshold, warning) rules for "when NOT to choose"
+    _WHEN_NOT_TO_CHOOSE_RULES = (
+        # Time-based warnings
+        (lambda a: a.time_analysis.estimated_time, operator.gt, 60,
+         "When you have time constraints - this route takes over an hour"),
+        (lambda a: a.time_analysis.time_range_max - a.time_analysis.time_range_min, operator.gt, 20,
+         "When punctuality is critical - travel time can vary by 20+ minutes"),
+        # Cost-based warnings
+        (lambda a: a.cost_analysis.total_cost, operator.gt, 15.0,
+         "When budget is tight - this is an expensive option"),
+        # Stress-based warnings
+        (lambda a: a.stress_analysis.overall_stress, operator.ge, 7,
+         "When you're already stressed - this route has high stress levels"),
+        (lambda a: a.stress_analysis.traffic_stress, operator.ge, 8,
+         "During heavy traffic periods - expect significant congestion stress"),
+        # Reliability-based warnings
+        (lambda a: a.reliability_analysis.overall_reliability, operator.le, 5,
+         "For important appointments - this route has unpredictable timing"),
+        (lambda a: a.reliability_analysis.incident_probability, operator.gt, 0.3,
+         "When you can't afford delays - high chance of incidents on this route"),
+        # Weather-based warnings
+        (lambda a: a.reliability_analysis.weather_impact, operator.gt, 0.4,
+         "In bad weather - this route is significantly affected by weather conditions"),
+    )
+    
+    # (metric getter, comparison, threshold, reason template) rules for recommendation
+    # strengths; the template is formatted with the metric value
+    _REASON_RULES = (
+        (lambda a: a.time_analysis.estimated_time, operator.le, 30,
+         "Quick {}-minute journey"),
+        (lambda a: a.cost_analysis.total_cost, operator.le, 3.0,
+         "Affordable at ${:.2f}"),
+        (lambda a: a.stress_analysis.overall_stress, operator.le, 4,
+         "Low-stress travel experience"),
+        (lambda a: a.reliability_analysis.overall_reliability, operator.ge, 8,
+         "Highly reliable timing"),
+    )
+    
+    # (metric index, comparison, threshold, text) rules over RouteAnalysis.metrics
+    # for strengths and weaknesses that hold regardless of the alternatives
+    _ABSOLUTE_STRENGTH_RULES = (
+        (0, operator.le, 20, "Very quick commute"),
+        (1, operator.le, 2.0, "Very affordable"),
+        (2, operator.le, 3, "Very low stress"),
+        (3, operator.ge, 8, "Highly predictable"),
+    )
+    _ABSOLUTE_WEAKNESS_RULES = (
+        (0, operator.gt, 90, "Very long commute"),
+        (1, operator.gt, 20.0, "Expensive option"),
+        (2, operator.ge, 8, "High stress levels"),
+        (3, operator.le, 4, "Unpredictable timing"),
+    )
+    
+    # Preference profile fields that what-if adjustments may change
+    _WEIGHT_FIELDS = ('time_weight', 'cost_weight', 'comfort_weight', 'reliability_weight')
+    
     def __init__(self):
         """Initialize the decision making engine."""
         pass
@@ -25,7 +352,8 @@ class DecisionMakingEngine:
         self, 
         routes: List[Route], 
         route_analyses: List[RouteAnalysis],
-        user_preferences: PreferenceProfile
+        user_preferences: PreferenceProfile,
+        top_k: Optional[int] = None
     ) -> List[Tuple[Route, RouteAnalysis, float]]:
         """
         Rank routes based on weighted criteria from user preferences.
@@ -34,6 +362,7 @@ class DecisionMakingEngine:
             routes: List of routes to rank
             route_analyses: Corresponding route analyses
             user_preferences: User's preference profile with weights
+            top_k: Only return the top K routes (all routes if None)
             
         Returns:
             List of tuples (route, analysis, score) sorted by score (highest first)
@@ -43,14 +372,17 @@ class DecisionMakingEngine:
         if len(routes) != len(route_analyses):
             raise ValueError("Number of routes must match number of analyses")
         
-        scored_routes = []
-        
-        for route, analysis in zip(routes, route_analyses):
-            score = self._calculate_weighted_score(route, analysis, user_preferences)
-            scored_routes.append((route, analysis, score))
+        # Pull the metrics out once and score every route in a single pass
+        weights = self._preference_weights(user_preferences)
+        scores = self._score_metrics(self._extract_metrics(route_analyses), weights)
+        scored_routes = list(zip(routes, route_analyses, scores))
         
-        # Sort by score (highest first)
-        scored_routes.sort(key=lambda x: x[2], reverse=True)
+        if top_k is not None and top_k < len(scored_routes):
+            # Partial selection is enough when callers only consume the top few
+            scored_routes = heapq.nlargest(top_k, scored_routes, key=_SCORE_KEY)
+        else:
+            # Sort by score (highest first)
+            scored_routes.sort(key=_SCORE_KEY, reverse=True)
         
         return scored_routes
     
@@ -63,7 +395,7 @@ class DecisionMakingEngine:
         Generate contextual recommendation with reasoning.
         
         Args:
-            ranked_routes: Routes ranked by preference score
+            ranked_routes: Routes ranked by preference score (only the top 3 are used)
             context: Current conditions and context information
             
         Returns:
@@ -93,17 +425,18 @@ class DecisionMakingEngine:
         # Calculate confidence based on score gap and route characteristics
         confidence = self._calculate_recommendation_confidence(ranked_routes)
         
-        # Prepare alternative routes
-        alternatives = []
-        for route, analysis, score in ranked_routes[1:3]:  # Up to 2 alternatives
-            alternatives.append({
+        # Prepare alternative routes (up to 2)
+        alternatives = [
+            {
                 "route": route,
                 "analysis": analysis,
                 "score": score,
                 "why_not_recommended": self._explain_why_not_recommended(
                     route, analysis, top_route, top_analysis
                 )
-            })
+            }
+            for route, analysis, score in ranked_routes[1:3]
+        ]
         
         return {
             "recommended_route": top_route,
@@ -142,20 +475,23 @@ class DecisionMakingEngine:
                 "decision_factors": []
             }
         
+        # Extract the route metrics once and share them with every helper
+        metrics = self._extract_metrics(route_analyses)
+        
         # Create comparison matrix
-        comparison_matrix = self._create_comparison_matrix(routes, route_analyses)
+        comparison_matrix = self._create_comparison_matrix(routes, route_analyses, metrics)
         
         # Identify key trade-offs
-        key_tradeoffs = self._identify_key_tradeoffs(routes, route_analyses)
+        key_tradeoffs = self._identify_key_tradeoffs(routes, route_analyses, metrics)
         
         # Extract decision factors
-        decision_factors = self._extract_decision_factors(routes, route_analyses)
+        decision_factors = self._extract_decision_factors(routes, route_analyses, metrics)
         
         return {
             "comparison_matrix": comparison_matrix,
             "key_tradeoffs": key_tradeoffs,
             "decision_factors": decision_factors,
-            "summary": self._generate_tradeoff_summary(routes, route_analyses)
+            "summary": self._generate_tradeoff_summary(routes, route_analyses, metrics)
         }
     
     def identify_when_not_to_choose(
@@ -180,49 +516,25 @@ class DecisionMakingEngine:
         if alternatives is None:
             alternatives = []
         
-        warnings = []
-        
-        # Time-based warnings
-        if analysis.time_analysis.estimated_time > 60:
-            warnings.append("When you have time constraints - this route takes over an hour")
-        
-        if analysis.time_analysis.time_range_max - analysis.time_analysis.time_range_min > 20:
-            warnings.append("When punctuality is critical - travel time can vary by 20+ minutes")
-        
-        # Cost-based warnings
-        if analysis.cost_analysis.total_cost > 15.0:
-            warnings.append("When budget is tight - this is an expensive option")
-        
-        # Stress-based warnings
-        if analysis.stress_analysis.overall_stress >= 7:
-            warnings.append("When you're already stressed - this route has high stress levels")
-        
-        if analysis.stress_analysis.traffic_stress >= 8:
-            warnings.append("During heavy traffic periods - expect significant congestion stress")
-        
-        # Reliability-based warnings
-        if analysis.reliability_analysis.overall_reliability <= 5:
-            warnings.append("For important appointments - this route has unpredictable timing")
-        
-        if analysis.reliability_analysis.incident_probability > 0.3:
-            warnings.append("When you can't afford delays - high chance of incidents on this route")
-        
-        # Weather-based warnings
-        if analysis.reliability_analysis.weather_impact > 0.4:
-            warnings.append("In bad weather - this route is significantly affected by weather conditions")
+        # Threshold-based warnings
+        warnings = [
+            message
+            for getter, compare, threshold, message in self._WHEN_NOT_TO_CHOOSE_RULES
+            if compare(getter(analysis), threshold)
+        ]
         
         # Mode-specific warnings
-        from commute_optimizer.models import TransportationMode
+        modes = set(route.transportation_modes)
         
-        if TransportationMode.CYCLING in route.transportation_modes:
+        if TransportationMode.CYCLING in modes:
             warnings.append("In rain, snow, or extreme temperatures")
             warnings.append("When you need to arrive looking professional")
         
-        if TransportationMode.PUBLIC_TRANSIT in route.transportation_modes:
+        if TransportationMode.PUBLIC_TRANSIT in modes:
             warnings.append("During transit strikes or major service disruptions")
             warnings.append("When carrying large or heavy items")
         
-        if TransportationMode.DRIVING in route.transportation_modes:
+        if TransportationMode.DRIVING in modes:
             warnings.append("When parking is unavailable or very expensive")
             warnings.append("During major traffic incidents on your route")
         
@@ -258,32 +570,36 @@ class DecisionMakingEngine:
                 "summary": "Only one route available - no trade-offs to explain."
             }
         
-        templates = []
+        # Build the route/analysis pairs once; each route's alternatives are the
+        # pairs on either side of it
+        pairs = list(zip(routes, route_analyses))
         
-        # Generate templates for each route
-        for i, (route, analysis) in enumerate(zip(routes, route_analyses)):
-            route_name = f"Route {i + 1}"
-            
-            # Create explanation template for this route
-            template = {
+        # Summarize metrics once so each route's comparisons avoid rescanning the others
+        stats = self._metric_stats(routes, route_analyses)
+        
+        # Generate an explanation template for each route
+        templates = [
+            {
                 "route_id": route.id,
-                "route_name": route_name,
-                "strengths": self._identify_route_strengths(route, analysis, routes, route_analyses),
-                "weaknesses": self._identify_route_weaknesses(route, analysis, routes, route_analyses),
-                "trade_offs": self._generate_specific_tradeoffs(route, analysis, routes, route_analyses),
+                "route_name": f"Route {i + 1}",
+                "strengths": self._identify_route_strengths(route, analysis, routes, route_analyses, stats),
+                "weaknesses": self._identify_route_weaknesses(route, analysis, routes, route_analyses, stats),
+                "trade_offs": self._generate_specific_tradeoffs(route, analysis, routes, route_analyses, stats),
                 "when_to_choose": self._generate_when_to_choose_guidance(route, analysis),
                 "when_not_to_choose": self.identify_when_not_to_choose(
-                    route, analysis, [(r, a) for r, a in zip(routes, route_analyses) if r.id != route.id]
+                    route, analysis, pairs[:i] + pairs[i + 1:]
                 ),
-                "comparison_highlights": self._generate_comparison_highlights(route, analysis, routes, route_analyses)
+                "comparison_highlights": self._generate_comparison_highlights(
+                    route, analysis, routes, route_analyses, stats
+                )
             }
-            
-            templates.append(template)
+            for i, (route, analysis) in enumerate(pairs)
+        ]
         
         return {
             "templates": templates,
-            "summary": self._generate_overall_tradeoff_summary(routes, route_analyses),
-            "decision_guidance": self._generate_decision_guidance(routes, route_analyses)
+            "summary": self._generate_overall_tradeoff_summary(routes, route_analyses, stats),
+            "decision_guidance": self._generate_decision_guidance(routes, route_analyses, stats)
         }
     
     def make_decision_factors_visible(
@@ -310,8 +626,21 @@ class DecisionMakingEngine:
         if context is None:
             context = {}
         
-        # Calculate scores for transparency
-        scored_routes = self.rank_routes(routes, route_analyses, user_preferences)
+        if len(routes) != len(route_analyses):
+            raise ValueError("Number of routes must match number of analyses")
+        
+        # Score and break down each route in one pass, then rank highest first
+        ranked = sorted(
+            (
+                (route, analysis, score, breakdown)
+                for route, analysis, (score, breakdown) in zip(
+                    routes, route_analyses, self._score_all_routes(route_analyses, user_preferences)
+                )
+            ),
+            key=_SCORE_KEY,
+            reverse=True
+        )
+        scored_routes = [(route, analysis, score) for route, analysis, score, _ in ranked]
         
         decision_factors = {
             "preference_weights": {
@@ -320,7 +649,16 @@ class DecisionMakingEngine:
                 "comfort_weight": user_preferences.comfort_weight,
                 "reliability_weight": user_preferences.reliability_weight
             },
-            "scoring_breakdown": [],
+            # Detailed scoring breakdown for each route
+            "scoring_breakdown": [
+                {
+                    "route_id": route.id,
+                    "total_score": score,
+                    "component_scores": breakdown,
+                    "score_explanation": self._explain_score_calculation(breakdown, user_preferences)
+                }
+                for route, _, score, breakdown in ranked
+            ],
             "context_factors": self._identify_context_factors(context),
             "route_comparisons": self._create_detailed_comparison_matrix(routes, route_analyses),
             "decision_logic": self._explain_decision_logic(scored_routes, user_preferences),
@@ -328,16 +666,6 @@ class DecisionMakingEngine:
             "assumptions": self._list_decision_assumptions(routes, route_analyses, context)
         }
         
-        # Add detailed scoring breakdown for each route
-        for route, analysis, score in scored_routes:
-            breakdown = self._calculate_score_breakdown(route, analysis, user_preferences)
-            decision_factors["scoring_breakdown"].append({
-                "route_id": route.id,
-                "total_score": score,
-                "component_scores": breakdown,
-                "score_explanation": self._explain_score_calculation(breakdown, user_preferences)
-            })
-        
         return decision_factors
     
     def _calculate_weighted_score(
@@ -351,29 +679,37 @@ class DecisionMakingEngine:
         
         Converts route characteristics to normalized scores (0-1) and applies preference weights.
         """
-        # Normalize scores to 0-1 scale (higher is better)
-        
-        # Time score (lower time is better)
-        time_score = max(0, 1 - (analysis.time_analysis.estimated_time / 120))  # 120 min = 0 score
-        
-        # Cost score (lower cost is better)
-        cost_score = max(0, 1 - (analysis.cost_analysis.total_cost / 20))  # $20 = 0 score
-        
-        # Comfort score (lower stress is better)
-        comfort_score = (10 - analysis.stress_analysis.overall_stress) / 9  # Convert 1-10 to 0-1
-        
-        # Reliability score (higher reliability is better)
-        reliability_score = (analysis.reliability_analysis.overall_reliability - 1) / 9  # Convert 1-10 to 0-1
+        weights = self._preference_weights(preferences)
+        return self._score_metrics(self._extract_metrics([analysis]), weights)[0]
+    
+    def _preference_weights(self, preferences: PreferenceProfile) -> Tuple[int, int, int, int]:
+        """
+        Read the (time, cost, comfort, reliability) percentage weights once.
         
-        # Apply preference weights (convert percentages to decimals)
-        weighted_score = (
-            (time_score * preferences.time_weight / 100) +
-            (cost_score * preferences.cost_weight / 100) +
-            (comfort_score * preferences.comfort_weight / 100) +
-            (reliability_score * preferences.reliability_weight / 100)
+        They stay percentages so every weighted term is computed as
+        score * weight / 100, matching the scores shown in explanations.
+        """
+        return (
+            preferences.time_weight,
+            preferences.cost_weight,
+            preferences.comfort_weight,
+            preferences.reliability_weight
         )
-        
-        return max(0.0, min(1.0, weighted_score))  # Ensure score is between 0 and 1
+    
+    def _extract_metrics(
+        self,
+        analyses: List[RouteAnalysis]
+    ) -> List[Tuple[int, float, int, int]]:
+        """Extract (time, cost, stress, reliability) for each analysis in one pass."""
+        return [analysis.metrics for analysis in analyses]
+    
+    def _score_metrics(
+        self,
+        metrics: List[Tuple[int, float, int, int]],
+        weights: Tuple[int, int, int, int]
+    ) -> List[float]:
+        """Score a batch of extracted route metrics with percentage preference weights."""
+        return [_weighted_score(*route_metrics, *weights) for route_metrics in metrics]
     
     def _generate_recommendation_reasoning(
         self,
@@ -395,31 +731,19 @@ class DecisionMakingEngine:
             reasons.append("This route is the best available option given current conditions")
         
         # Specific strength-based reasoning
-        time_minutes = recommended_analysis.time_analysis.estimated_time
-        cost = recommended_analysis.cost_analysis.total_cost
-        stress = recommended_analysis.stress_analysis.overall_stress
-        reliability = recommended_analysis.reliability_analysis.overall_reliability
-        
-        if time_minutes <= 30:
-            reasons.append(f"Quick {time_minutes}-minute journey")
-        
-        if cost <= 3.0:
-            reasons.append(f"Affordable at ${cost:.2f}")
-        
-        if stress <= 4:
-            reasons.append("Low-stress travel experience")
-        
-        if reliability >= 8:
-            reasons.append("Highly reliable timing")
+        for getter, compare, threshold, template in self._REASON_RULES:
+            value = getter(recommended_analysis)
+            if compare(value, threshold):
+                reasons.append(template.format(value))
         
         # Context-based reasoning
-        weather_data = context.get('weather_data', {})
-        if weather_data.get('condition') in ['rain', 'snow']:
-            if any(mode.value in ['public_transit', 'driving'] 
+        weather_data = context.get('weather_data') or _EMPTY
+        if weather_data.get('condition') in _BAD_WEATHER_CONDITIONS:
+            if any(mode.value in _WEATHER_SAFE_MODES
                    for mode in recommended_route.transportation_modes):
                 reasons.append("Good choice for current weather conditions")
         
-        traffic_data = context.get('traffic_data', {})
+        traffic_data = context.get('traffic_data') or _EMPTY
         if traffic_data.get('congestion_level') == 'heavy':
             if recommended_analysis.stress_analysis.traffic_stress <= 5:
                 reasons.append("Avoids the worst traffic congestion")
@@ -498,17 +822,17 @@ class DecisionMakingEngine:
         """Identify relevant context factors that influenced the recommendation."""
         factors = []
         
-        weather_data = context.get('weather_data', {})
+        weather_data = context.get('weather_data') or _EMPTY
         weather_condition = weather_data.get('condition', 'clear')
         if weather_condition != 'clear':
             factors.append(f"Current weather: {weather_condition}")
         
-        traffic_data = context.get('traffic_data', {})
+        traffic_data = context.get('traffic_data') or _EMPTY
         congestion_level = traffic_data.get('congestion_level', 'moderate')
-        if congestion_level in ['heavy', 'severe']:
+        if congestion_level in _HEAVY_CONGESTION_LEVELS:
             factors.append(f"Traffic conditions: {congestion_level} congestion")
         
-        transit_data = context.get('transit_data', {})
+        transit_data = context.get('transit_data') or _EMPTY
         service_status = transit_data.get('service_status', 'normal')
         if service_status != 'normal':
             factors.append(f"Transit status: {service_status}")
@@ -518,54 +842,49 @@ class DecisionMakingEngine:
     def _create_comparison_matrix(
         self, 
         routes: List[Route], 
-        analyses: List[RouteAnalysis]
+        analyses: List[RouteAnalysis],
+        metrics: Optional[List[Tuple[int, float, int, int]]] = None
     ) -> List[Dict[str, Any]]:
         """Create a matrix comparing routes across all criteria."""
-        matrix = []
-        
-        criteria = ['Time', 'Cost', 'Stress', 'Reliability']
+        if metrics is None:
+            metrics = self._extract_metrics(analyses)
         
-        for i, (route, analysis) in enumerate(zip(routes, analyses)):
-            route_comparison = {
+        return [
+            {
                 'route_id': route.id,
                 'route_name': f"Route {i + 1}",
                 'transportation_modes': [mode.value for mode in route.transportation_modes],
-                'comparisons': {}
-            }
-            
-            # Add values for each criterion
-            route_comparison['comparisons']['Time'] = {
-                'value': analysis.time_analysis.estimated_time,
-                'unit': 'minutes',
-                'display': f"{analysis.time_analysis.estimated_time} min"
-            }
-            
-            route_comparison['comparisons']['Cost'] = {
-                'value': analysis.cost_analysis.total_cost,
-                'unit': 'dollars',
-                'display': f"${analysis.cost_analysis.total_cost:.2f}"
-            }
-            
-            route_comparison['comparisons']['Stress'] = {
-                'value': analysis.stress_analysis.overall_stress,
-                'unit': 'scale_1_10',
-                'display': f"{analysis.stress_analysis.overall_stress}/10"
-            }
-            
-            route_comparison['comparisons']['Reliability'] = {
-                'value': analysis.reliability_analysis.overall_reliability,
-                'unit': 'scale_1_10',
-                'display': f"{analysis.reliability_analysis.overall_reliability}/10"
+                'comparisons': {
+                    'Time': {
+                        'value': time,
+                        'unit': 'minutes',
+                        'display': f"{time} min"
+                    },
+                    'Cost': {
+                        'value': cost,
+                        'unit': 'dollars',
+                        'display': f"${cost:.2f}"
+                    },
+                    'Stress': {
+                        'value': stress,
+                        'unit': 'scale_1_10',
+                        'display': f"{stress}/10"
+                    },
+                    'Reliability': {
+                        'value': reliability,
+                        'unit': 'scale_1_10',
+                        'display': f"{reliability}/10"
+                    }
+                }
             }
-            
-            matrix.append(route_comparison)
-        
-        return matrix
+            for i, (route, (time, cost, stress, reliability)) in enumerate(zip(routes, metrics))
+        ]
     
     def _identify_key_tradeoffs(
         self, 
         routes: List[Route], 
-        analyses: List[RouteAnalysis]
+        analyses: List[RouteAnalysis],
+        metrics: Optional[List[Tuple[int, float, int, int]]] = None
     ) -> List[Dict[str, Any]]:
         """Identify the most significant trade-offs between routes."""
         if len(routes) < 2:
@@ -573,42 +892,53 @@ class DecisionMakingEngine:
         
         tradeoffs = []
         
+        # Read each route's metrics once instead of once per pair
+        if metrics is None:
+            metrics = self._extract_metrics(analyses)
+        
         # Find routes with significant differences
-        for i in range(len(routes)):
-            for j in range(i + 1, len(routes)):
-                route1, analysis1 = routes[i], analyses[i]
-                route2, analysis2 = routes[j], analyses[j]
+        for i, (time1, cost1, stress1, reliability1) in enumerate(metrics):
+            route1_name = f"Route {i + 1}"
+            
+            for j in range(i + 1, len(metrics)):
+                time2, cost2, stress2, reliability2 = metrics[j]
                 
-                # Time vs Cost tradeoff
-                time_diff = analysis2.time_analysis.estimated_time - analysis1.time_analysis.estimated_time
-                cost_diff = analysis1.cost_analysis.total_cost - analysis2.cost_analysis.total_cost
+                time_diff = time2 - time1
+                cost_diff = cost1 - cost2
+                stress_diff = stress1 - stress2
+                reliability_diff = reliability1 - reliability2
+                
+                # Skip pairs that cannot produce any trade-off
+                if cost_diff <= 2.0 and (time_diff <= 10 or stress_diff <= 2):
+                    continue
                 
+                route2_name = f"Route {j + 1}"
+                
+                # Time vs Cost tradeoff
                 if time_diff > 15 and cost_diff > 3.0:  # Route 1 faster but more expensive
                     tradeoffs.append({
                         'type': 'time_vs_cost',
-                        'route1': f"Route {i + 1}",
-                        'route2': f"Route {j + 1}",
-                        'description': f"Route {i + 1} is {time_diff} minutes faster but costs ${cost_diff:.2f} more"
+                        'route1': route1_name,
+                        'route2': route2_name,
+                        'description': f"{route1_name} is {time_diff} minutes faster but costs ${cost_diff:.2f} more"
                     })
                 
                 # Stress vs Time tradeoff
-                stress_diff = analysis1.stress_analysis.overall_stress - analysis2.stress_analysis.overall_stress
                 if time_diff > 10 and stress_diff > 2:  # Route 1 faster but more stressful
                     tradeoffs.append({
                         'type': 'time_vs_stress',
-                        'route1': f"Route {i + 1}",
-                        'route2': f"Route {j + 1}",
-                        'description': f"Route {i + 1} is {time_diff} minutes faster but {stress_diff} points more stressful"
+                        'route1': route1_name,
+                        'route2': route2_name,
+                        'description': f"{route1_name} is {time_diff} minutes faster but {stress_diff} points more stressful"
                     })
                 
                 # Reliability vs Cost tradeoff
-                reliability_diff = analysis1.reliability_analysis.overall_reliability - analysis2.reliability_analysis.overall_reliability
                 if reliability_diff > 2 and cost_diff > 2.0:  # Route 1 more reliable but more expensive
                     tradeoffs.append({
                         'type': 'reliability_vs_cost',
-                        'route1': f"Route {i + 1}",
-                        'route2': f"Route {j + 1}",
-                        'description': f"Route {i + 1} is more reliable but costs ${cost_diff:.2f} more"
+                        'route1': route1_name,
+                        'route2': route2_name,
+                        'description': f"{route1_name} is more reliable but costs ${cost_diff:.2f} more"
                     })
         
         return tradeoffs
@@ -616,14 +946,19 @@ class DecisionMakingEngine:
     def _extract_decision_factors(
         self, 
         routes: List[Route], 
-        analyses: List[RouteAnalysis]
+        analyses: List[RouteAnalysis],
+        metrics: Optional[List[Tuple[int, float, int, int]]] = None
     ) -> List[Dict[str, Any]]:
         """Extract key factors that should influence the decision."""
+        if metrics is None:
+            metrics = self._extract_metrics(analyses)
+        
         factors = []
+        mins, maxs = self._metric_bounds(metrics)
+        min_time, min_cost, min_stress, min_reliability = mins
+        max_time, max_cost, max_stress, max_reliability = maxs
         
         # Time factor
-        times = [analysis.time_analysis.estimated_time for analysis in analyses]
-        min_time, max_time = min(times), max(times)
         if max_time - min_time > 15:  # Significant time difference
             factors.append({
                 'factor': 'Travel Time',
@@ -633,8 +968,6 @@ class DecisionMakingEngine:
             })
         
         # Cost factor
-        costs = [analysis.cost_analysis.total_cost for analysis in analyses]
-        min_cost, max_cost = min(costs), max(costs)
         if max_cost - min_cost > 3.0:  # Significant cost difference
             factors.append({
                 'factor': 'Cost',
@@ -644,8 +977,6 @@ class DecisionMakingEngine:
             })
         
         # Stress factor
-        stress_levels = [analysis.stress_analysis.overall_stress for analysis in analyses]
-        min_stress, max_stress = min(stress_levels), max(stress_levels)
         if max_stress - min_stress > 3:  # Significant stress difference
             factors.append({
                 'factor': 'Stress Level',
@@ -655,8 +986,6 @@ class DecisionMakingEngine:
             })
         
         # Reliability factor
-        reliability_scores = [analysis.reliability_analysis.overall_reliability for analysis in analyses]
-        min_reliability, max_reliability = min(reliability_scores), max(reliability_scores)
         if max_reliability - min_reliability > 2:  # Significant reliability difference
             factors.append({
                 'factor': 'Reliability',
@@ -667,25 +996,114 @@ class DecisionMakingEngine:
         
         return factors
     
+    def _metric_bounds(
+        self,
+        metrics: List[Tuple[int, float, int, int]]
+    ) -> Tuple[Tuple[int, float, int, int], Tuple[int, float, int, int]]:
+        """Get per-criterion minimums and maximums of extracted route metrics."""
+        columns = list(zip(*metrics))
+        return tuple(map(min, columns)), tuple(map(max, columns))
+    
+    def _metric_stats(self, routes: List[Route], analyses: List[RouteAnalysis]) -> Dict[str, Any]:
+        """
+        Summarize route metrics once for repeated "this route vs. the others" comparisons.
+        
+        Keeps per-criterion sums and the indices of the two lowest and two highest
+        values (earliest route first on ties), which is enough to get the min, max
+        and mean of every other route without rescanning them. The positions of
+        each route id are kept so "others" can exclude every route sharing an id,
+        and the per-route results are memoized in "others" by id since several
+        helpers ask for each route.
+        """
+        columns = list(zip(*self._extract_metrics(analyses)))
+        indices = range(len(analyses))
+        positions = {}
+        for i, route in enumerate(routes):
+            positions.setdefault(route.id, []).append(i)
+        return {
+            "count": len(analyses),
+            "columns": columns,
+            "sums": [sum(column) for column in columns],
+            "lowest": [heapq.nsmallest(2, indices, key=column.__getitem__) for column in columns],
+            "highest": [heapq.nlargest(2, indices, key=column.__getitem__) for column in columns],
+            "positions": positions,
+            "others": {}
+        }
+    
+    def _other_route_stats(
+        self,
+        route: Route,
+        all_routes: List[Route],
+        all_analyses: List[RouteAnalysis],
+        stats: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[_CriterionStats, ...]]:
+        """
+        Get (time, cost, stress, reliability) stats over every route with a different id.
+        
+        Returns None when there are no other routes to compare against.
+        """
+        if stats is None:
+            stats = self._metric_stats(all_routes, all_analyses)
+        elif route.id in stats["others"]:
+            return stats["others"][route.id]
+        
+        excluded = stats["positions"].get(route.id, [])
+        count = stats["count"] - len(excluded)
+        if count == 0:
+            stats["others"][route.id] = None
+            return None
+        
+        # Several routes sharing this id can't be patched out of the two-deep
+        # extremes, so rescan the remaining routes instead
+        remaining = None
+        if len(excluded) > 1:
+            remaining = [i for i in range(stats["count"]) if i not in excluded]
+        
+        others = []
+        for column, total, lowest, highest in zip(
+            stats["columns"], stats["sums"], stats["lowest"], stats["highest"]
+        ):
+            if remaining is not None:
+                min_index = min(remaining, key=column.__getitem__)
+                max_index = max(remaining, key=column.__getitem__)
+                total = sum(column[i] for i in remaining)
+            else:
+                min_index = lowest[1] if lowest[0] in excluded else lowest[0]
+                max_index = highest[1] if highest[0] in excluded else highest[0]
+                for i in excluded:
+                    total -= column[i]
+            others.append(_CriterionStats(
+                minimum=column[min_index],
+                maximum=column[max_index],
+                mean=total / count,
+                min_index=min_index,
+                max_index=max_index
+            ))
+        
+        stats["others"][route.id] = tuple(others)
+        return stats["others"][route.id]
+    
     def _generate_tradeoff_summary(
         self, 
         routes: List[Route], 
-        analyses: List[RouteAnalysis]
+        analyses: List[RouteAnalysis],
+        metrics: Optional[List[Tuple[int, float, int, int]]] = None
     ) -> str:
         """Generate a high-level summary of the trade-offs."""
         if len(routes) < 2:
             return "Only one route available - no trade-offs to consider."
         
-        # Find the route that's best in each category
-        times = [(analysis.time_analysis.estimated_time, i) for i, analysis in enumerate(analyses)]
-        costs = [(analysis.cost_analysis.total_cost, i) for i, analysis in enumerate(analyses)]
-        stress_levels = [(analysis.stress_analysis.overall_stress, i) for i, analysis in enumerate(analyses)]
-        reliability_scores = [(analysis.reliability_analysis.overall_reliability, i) for i, analysis in enumerate(analyses)]
+        # Find the route that's best in each category (ties go to the first route,
+        # except reliability where they go to the last)
+        if metrics is None:
+            metrics = self._extract_metrics(analyses)
+        times, costs, stress_levels, reliability_scores = zip(*metrics)
+        indices = range(len(analyses))
         
-        fastest_route = min(times)[1] + 1
-        cheapest_route = min(costs)[1] + 1
-        least_stressful_route = min(stress_levels)[1] + 1
-        most_reliable_route = max(reliability_scores)[1] + 1
+        fastest_route = min(indices, key=times.__getitem__) + 1
+        cheapest_route = min(indices, key=costs.__getitem__) + 1
+        least_stressful_route = min(indices, key=stress_levels.__getitem__) + 1
+        most_reliable_route = max(reversed(indices), key=reliability_scores.__getitem__) + 1
         
         summary_parts = []
         
@@ -717,32 +1135,29 @@ class DecisionMakingEngine:
             return
         
         # Find if this route is significantly worse in any category
-        alt_times = [alt_analysis.time_analysis.estimated_time for _, alt_analysis in alternatives]
-        alt_costs = [alt_analysis.cost_analysis.total_cost for _, alt_analysis in alternatives]
-        alt_stress = [alt_analysis.stress_analysis.overall_stress for _, alt_analysis in alternatives]
-        alt_reliability = [alt_analysis.reliability_analysis.overall_reliability for _, alt_analysis in alternatives]
-        
-        min_alt_time = min(alt_times)
-        min_alt_cost = min(alt_costs)
-        min_alt_stress = min(alt_stress)
-        max_alt_reliability = max(alt_reliability)
+        time, cost, stress, reliability = self._extract_metrics([analysis])[0]
+        alt_mins, alt_maxs = self._metric_bounds(
+            self._extract_metrics([alt_analysis for _, alt_analysis in alternatives])
+        )
+        min_alt_time, min_alt_cost, min_alt_stress, _ = alt_mins
+        max_alt_reliability = alt_maxs[3]
         
         # Time comparison
-        if analysis.time_analysis.estimated_time > min_alt_time + 20:
-            time_diff = analysis.time_analysis.estimated_time - min_alt_time
+        if time > min_alt_time + 20:
+            time_diff = time - min_alt_time
             warnings.append(f"When time is important - alternatives are {time_diff} minutes faster")
         
         # Cost comparison
-        if analysis.cost_analysis.total_cost > min_alt_cost + 5.0:
-            cost_diff = analysis.cost_analysis.total_cost - min_alt_cost
+        if cost > min_alt_cost + 5.0:
+            cost_diff = cost - min_alt_cost
             warnings.append(f"When budget matters - alternatives cost ${cost_diff:.2f} less")
         
         # Stress comparison
-        if analysis.stress_analysis.overall_stress > min_alt_stress + 3:
+        if stress > min_alt_stress + 3:
             warnings.append("When you want a relaxing commute - alternatives are much less stressful")
         
         # Reliability comparison
-        if analysis.reliability_analysis.overall_reliability < max_alt_reliability - 3:
+        if reliability < max_alt_reliability - 3:
             warnings.append("When punctuality is critical - alternatives are much more reliable")
     
     def apply_dynamic_preference_weights(
@@ -794,26 +1209,23 @@ class DecisionMakingEngine:
             'total_weight': 0
         }
         
+        weights = (preferences.time_weight, preferences.cost_weight,
+                   preferences.comfort_weight, preferences.reliability_weight)
+        lowest_weight, highest_weight = min(weights), max(weights)
+        
         try:
-            self._validate_preference_weights(preferences)
-            validation_result['total_weight'] = (
-                preferences.time_weight + preferences.cost_weight + 
-                preferences.comfort_weight + preferences.reliability_weight
-            )
+            validation_result['total_weight'] = self._validate_preference_weights(preferences)
         except ValueError as e:
             validation_result['is_valid'] = False
             validation_result['errors'].append(str(e))
         
         # Add warnings for extreme weight distributions
-        weights = [preferences.time_weight, preferences.cost_weight, 
-                  preferences.comfort_weight, preferences.reliability_weight]
-        
-        if max(weights) > 70:
+        if highest_weight > 70:
             validation_result['warnings'].append(
                 "One preference dominates (>70%) - consider balancing for better results"
             )
         
-        if min(weights) == 0:
+        if lowest_weight == 0:
             validation_result['warnings'].append(
                 "Some preferences are ignored (0%) - this may limit route options"
             )
@@ -846,6 +1258,9 @@ class DecisionMakingEngine:
             'profiles': []
         }
         
+        # Resolve profile names to list positions once instead of scanning per check
+        profile_index = self._build_profile_index(user_preferences.preference_profiles)
+        
         if action == 'list':
             result['success'] = True
             result['profiles'] = [
@@ -869,7 +1284,7 @@ class DecisionMakingEngine:
                 return result
             
             # Check if profile already exists
-            if any(p.name == profile_data['name'] for p in user_preferences.preference_profiles):
+            if profile_data['name'] in profile_index:
                 result['message'] = f"Profile '{profile_data['name']}' already exists"
                 return result
             
@@ -889,11 +1304,7 @@ class DecisionMakingEngine:
                 return result
             
             # Find existing profile
-            profile_to_update = None
-            for i, profile in enumerate(user_preferences.preference_profiles):
-                if profile.name == profile_data['name']:
-                    profile_to_update = i
-                    break
+            profile_to_update = profile_index.get(profile_data['name'])
             
             if profile_to_update is None:
                 result['message'] = f"Profile '{profile_data['name']}' not found"
@@ -922,13 +1333,12 @@ class DecisionMakingEngine:
                 result['message'] = "Cannot delete the only remaining profile"
                 return result
             
-            # Find and remove profile
-            original_count = len(user_preferences.preference_profiles)
-            user_preferences.preference_profiles = [
-                p for p in user_preferences.preference_profiles if p.name != profile_name
-            ]
+            # Find and remove profile in place
+            profile_to_delete = profile_index.get(profile_name)
             
-            if len(user_preferences.preference_profiles) < original_count:
+            if profile_to_delete is not None:
+                del user_preferences.preference_profiles[profile_to_delete]
+                
                 # If we deleted the default profile, set a new default
                 if profile_name == user_preferences.default_profile:
                     user_preferences.default_profile = user_preferences.preference_profiles[0].name
@@ -947,7 +1357,7 @@ class DecisionMakingEngine:
             profile_name = profile_data['name']
             
             # Check if profile exists
-            if not any(p.name == profile_name for p in user_preferences.preference_profiles):
+            if profile_name not in profile_index:
                 result['message'] = f"Profile '{profile_name}' not found"
                 return result
             
@@ -985,17 +1395,69 @@ class DecisionMakingEngine:
         # Get current rankings
         current_rankings = self.rank_routes(routes, route_analyses, current_preferences)
         
-        # Get new rankings with proposed changes
-        try:
-            new_rankings = self.apply_dynamic_preference_weights(
-                routes, route_analyses, current_preferences, weight_changes
+        return self._preference_impact(
+            routes, route_analyses, current_preferences, current_rankings, weight_changes
+        )
+    
+    def batch_preference_impact(
+        self,
+        routes: List[Route],
+        route_analyses: List[RouteAnalysis],
+        current_preferences: PreferenceProfile,
+        weight_change_list: List[Dict[str, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several proposed preference weight changes against one baseline ranking.
+        
+        Args:
+            routes: List of routes to analyze
+            route_analyses: Corresponding route analyses
+            current_preferences: Current preference profile
+            weight_change_list: Proposed weight changes, one preview each
+            
+        Returns:
+            Impact analysis for each proposal, in the same order
+            
+        Validates: Requirements 3.2, 3.5
+        """
+        # Rank the current preferences once and diff every preview against it
+        current_rankings = self.rank_routes(routes, route_analyses, current_preferences)
+        
+        return [
+            self._preference_impact(
+                routes, route_analyses, current_preferences, current_rankings, weight_changes
             )
-        except ValueError as e:
-            return {
-                'valid': False,
-                'error': str(e),
-                'impact': None
-            }
+            for weight_changes in weight_change_list
+        ]
+    
+    def _preference_impact(
+        self,
+        routes: List[Route],
+        route_analyses: List[RouteAnalysis],
+        current_preferences: PreferenceProfile,
+        current_rankings: List[Tuple[Route, RouteAnalysis, float]],
+        weight_changes: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Compare the current rankings with those under one proposed weight change."""
+        # Get new rankings with proposed changes (nothing to re-rank for a no-op preview)
+        current_weights = tuple(getattr(current_preferences, field) for field in self._WEIGHT_FIELDS)
+        proposed_weights = tuple(
+            weight_changes.get(field, weight) for field, weight in zip(self._WEIGHT_FIELDS, current_weights)
+        )
+        
+        if proposed_weights == current_weights:
+            new_rankings = current_rankings
+        else:
+            try:
+                new_rankings = self.apply_dynamic_preference_weights(
+                    routes, route_analyses, current_preferences, weight_changes
+                )
+            except ValueError as e:
+                return {
+                    'valid': False,
+                    'error': str(e),
+                    'impact': None
+                }
         
         # Analyze the impact
         impact_analysis = {
@@ -1006,13 +1468,14 @@ class DecisionMakingEngine:
             'recommendation_changed': False
         }
         
-        # Track ranking changes
-        current_order = [route.id for route, _, _ in current_rankings]
-        new_order = [route.id for route, _, _ in new_rankings]
+        # Track ranking changes (the first occurrence of a repeated id wins)
+        new_positions = {}
+        for i, (route, _, _) in enumerate(new_rankings, start=1):
+            new_positions.setdefault(route.id, i)
         
-        for i, route_id in enumerate(current_order):
-            old_position = i + 1
-            new_position = new_order.index(route_id) + 1
+        for old_position, (route, _, _) in enumerate(current_rankings, start=1):
+            route_id = route.id
+            new_position = new_positions[route_id]
             
             if old_position != new_position:
                 impact_analysis['ranking_changes'].append({
@@ -1050,56 +1513,61 @@ class DecisionMakingEngine:
         base_preferences: PreferenceProfile,
         weight_adjustments: Dict[str, int]
     ) -> PreferenceProfile:
-        """Create a new preference profile with adjusted weights."""
-        # Start with base preferences
+        """
+        Create a new preference profile with adjusted weights.
+        
+        The other fields are passed straight through from the base profile
+        (its mode and feature tuples are read-only, so they need no copying).
+        Weights are validated by the constructor: they are coerced to integers
+        and must still sum to 100.
+        """
         adjusted_weights = {
-            'time_weight': base_preferences.time_weight,
-            'cost_weight': base_preferences.cost_weight,
-            'comfort_weight': base_preferences.comfort_weight,
-            'reliability_weight': base_preferences.reliability_weight
+            weight_name: getattr(base_preferences, weight_name)
+            for weight_name in self._WEIGHT_FIELDS
         }
-        
-        # Apply adjustments
         for weight_name, new_value in weight_adjustments.items():
             if weight_name in adjusted_weights:
                 adjusted_weights[weight_name] = new_value
         
-        # Create new preference profile
         return PreferenceProfile(
             name=f"{base_preferences.name}_adjusted",
-            time_weight=adjusted_weights['time_weight'],
-            cost_weight=adjusted_weights['cost_weight'],
-            comfort_weight=adjusted_weights['comfort_weight'],
-            reliability_weight=adjusted_weights['reliability_weight'],
+            **adjusted_weights,
             max_walking_distance=base_preferences.max_walking_distance,
-            preferred_modes=base_preferences.preferred_modes.copy(),
-            avoided_features=base_preferences.avoided_features.copy()
+            preferred_modes=base_preferences.preferred_modes,
+            avoided_features=base_preferences.avoided_features
         )
     
-    def _validate_preference_weights(self, preferences: PreferenceProfile) -> None:
+    def _validate_preference_weights(self, preferences: PreferenceProfile) -> int:
         """
         Validate that preference weights sum to 100% and are within valid ranges.
         
+        Returns:
+            The validated total weight
+        
         Raises:
             ValueError: If weights are invalid
         """
-        total_weight = (preferences.time_weight + preferences.cost_weight + 
-                       preferences.comfort_weight + preferences.reliability_weight)
+        weights = (preferences.time_weight, preferences.cost_weight,
+                   preferences.comfort_weight, preferences.reliability_weight)
+        total_weight = sum(weights)
         
         if total_weight != 100:
             raise ValueError(f"Preference weights must sum to 100%, got {total_weight}%")
         
-        # Check individual weight ranges
-        weights = {
-            'time_weight': preferences.time_weight,
-            'cost_weight': preferences.cost_weight,
-            'comfort_weight': preferences.comfort_weight,
-            'reliability_weight': preferences.reliability_weight
-        }
+        # Check individual weight ranges, only naming the culprit once one is out of range
+        if min(weights) < 0 or max(weights) > 100:
+            for weight_name, weight_value in zip(self._WEIGHT_FIELDS, weights):
+                if not (0 <= weight_value <= 100):
+                    raise ValueError(f"{weight_name} must be between 0 and 100, got {weight_value}")
         
-        for weight_name, weight_value in weights.items():
-            if not (0 <= weight_value <= 100):
-                raise ValueError(f"{weight_name} must be between 0 and 100, got {weight_value}")
+        return total_weight
+    
+    def _build_profile_index(self, profiles: List[PreferenceProfile]) -> Dict[str, int]:
+        """Map profile names to their list positions (first profile wins on duplicate names)."""
+        profile_index = {}
+        for i, profile in enumerate(profiles):
+            profile_index.setdefault(profile.name, i)
+        return profile_index
     
     def _create_preference_profile_from_data(self, profile_data: Dict[str, Any]) -> PreferenceProfile:
         """
@@ -1128,8 +1596,8 @@ class DecisionMakingEngine:
             comfort_weight=profile_data['comfort_weight'],
             reliability_weight=profile_data['reliability_weight'],
             max_walking_distance=profile_data.get('max_walking_distance', 2.0),
-            preferred_modes=profile_data.get('preferred_modes', []),
-            avoided_features=profile_data.get('avoided_features', [])
+            preferred_modes=profile_data.get('preferred_modes', ()),
+            avoided_features=profile_data.get('avoided_features', ())
         )
         
         return profile
@@ -1139,110 +1607,98 @@ class DecisionMakingEngine:
         route: Route,
         analysis: RouteAnalysis,
         all_routes: List[Route],
-        all_analyses: List[RouteAnalysis]
+        all_analyses: List[RouteAnalysis],
+        stats: Optional[Dict[str, Any]] = None
     ) -> List[str]:
         """Identify the strengths of a route compared to alternatives."""
         strengths = []
         
         # Compare against other routes
-        other_analyses = [a for r, a in zip(all_routes, all_analyses) if r.id != route.id]
+        others = self._other_route_stats(route, all_routes, all_analyses, stats)
         
-        if not other_analyses:
+        if others is None:
             return strengths
         
+        other_time, other_cost, other_stress, other_reliability = others
+        time, cost, stress, reliability = analysis.metrics
+        
         # Time strengths
-        other_times = [a.time_analysis.estimated_time for a in other_analyses]
-        if analysis.time_analysis.estimated_time <= min(other_times):
-            strengths.append(f"Fastest option at {analysis.time_analysis.estimated_time} minutes")
-        elif analysis.time_analysis.estimated_time < sum(other_times) / len(other_times):
+        if time <= other_time.minimum:
+            strengths.append(f"Fastest option at {time} minutes")
+        elif time < other_time.mean:
             strengths.append("Faster than average")
         
         # Cost strengths
-        other_costs = [a.cost_analysis.total_cost for a in other_analyses]
-        if analysis.cost_analysis.total_cost <= min(other_costs):
-            strengths.append(f"Most affordable at ${analysis.cost_analysis.total_cost:.2f}")
-        elif analysis.cost_analysis.total_cost < sum(other_costs) / len(other_costs):
+        if cost <= other_cost.minimum:
+            strengths.append(f"Most affordable at ${cost:.2f}")
+        elif cost < other_cost.mean:
             strengths.append("Below average cost")
         
         # Stress strengths
-        other_stress = [a.stress_analysis.overall_stress for a in other_analyses]
-        if analysis.stress_analysis.overall_stress <= min(other_stress):
+        if stress <= other_stress.minimum:
             strengths.append("Least stressful option")
-        elif analysis.stress_analysis.overall_stress < sum(other_stress) / len(other_stress):
+        elif stress < other_stress.mean:
             strengths.append("Lower stress than alternatives")
         
         # Reliability strengths
-        other_reliability = [a.reliability_analysis.overall_reliability for a in other_analyses]
-        if analysis.reliability_analysis.overall_reliability >= max(other_reliability):
+        if reliability >= other_reliability.maximum:
             strengths.append("Most reliable timing")
-        elif analysis.reliability_analysis.overall_reliability > sum(other_reliability) / len(other_reliability):
+        elif reliability > other_reliability.mean:
             strengths.append("More reliable than average")
         
         # Absolute strengths
-        if analysis.time_analysis.estimated_time <= 20:
-            strengths.append("Very quick commute")
-        
-        if analysis.cost_analysis.total_cost <= 2.0:
-            strengths.append("Very affordable")
-        
-        if analysis.stress_analysis.overall_stress <= 3:
-            strengths.append("Very low stress")
-        
-        if analysis.reliability_analysis.overall_reliability >= 8:
-            strengths.append("Highly predictable")
+        strengths.extend(self._matching_metric_rules(analysis.metrics, self._ABSOLUTE_STRENGTH_RULES))
         
         return strengths
     
+    def _matching_metric_rules(
+        self,
+        metrics: Tuple[int, float, int, int],
+        rules: Tuple[Tuple[int, Any, float, str], ...]
+    ) -> List[str]:
+        """Get the text of every (metric index, comparison, threshold, text) rule the metrics satisfy."""
+        return [text for i, compare, threshold, text in rules if compare(metrics[i], threshold)]
+    
     def _identify_route_weaknesses(
         self,
         route: Route,
         analysis: RouteAnalysis,
         all_routes: List[Route],
-        all_analyses: List[RouteAnalysis]
+        all_analyses: List[RouteAnalysis],
+        stats: Optional[Dict[str, Any]] = None
     ) -> List[str]:
         """Identify the weaknesses of a route compared to alternatives."""
         weaknesses = []
         
         # Compare against other routes
-        other_analyses = [a for r, a in zip(all_routes, all_analyses) if r.id != route.id]
+        others = self._other_route_stats(route, all_routes, all_analyses, stats)
         
-        if not other_analyses:
+        if others is None:
             return weaknesses
         
+        other_time, other_cost, other_stress, other_reliability = others
+        time, cost, stress, reliability = analysis.metrics
+        
         # Time weaknesses
-        other_times = [a.time_analysis.estimated_time for a in other_analyses]
-        if analysis.time_analysis.estimated_time >= max(other_times):
-            time_diff = analysis.time_analysis.estimated_time - min(other_times)
+        if time >= other_time.maximum:
+            time_diff = time - other_time.minimum
             weaknesses.append(f"Slowest option - {time_diff} minutes longer than fastest")
         
         # Cost weaknesses
-        other_costs = [a.cost_analysis.total_cost for a in other_analyses]
-        if analysis.cost_analysis.total_cost >= max(other_costs):
-            cost_diff = analysis.cost_analysis.total_cost - min(other_costs)
+        if cost >= other_cost.maximum:
+            cost_diff = cost - other_cost.minimum
             weaknesses.append(f"Most expensive - ${cost_diff:.2f} more than cheapest")
         
         # Stress weaknesses
-        other_stress = [a.stress_analysis.overall_stress for a in other_analyses]
-        if analysis.stress_analysis.overall_stress >= max(other_stress):
+        if stress >= other_stress.maximum:
             weaknesses.append("Most stressful option")
         
         # Reliability weaknesses
-        other_reliability = [a.reliability_analysis.overall_reliability for a in other_analyses]
-        if analysis.reliability_analysis.overall_reliability <= min(other_reliability):
+        if reliability <= other_reliability.minimum:
             weaknesses.append("Least reliable timing")
         
         # Absolute weaknesses
-        if analysis.time_analysis.estimated_time > 90:
-            weaknesses.append("Very long commute")
-        
-        if analysis.cost_analysis.total_cost > 20.0:
-            weaknesses.append("Expensive option")
-        
-        if analysis.stress_analysis.overall_stress >= 8:
-            weaknesses.append("High stress levels")
-        
-        if analysis.reliability_analysis.overall_reliability <= 4:
-            weaknesses.append("Unpredictable timing")
+        weaknesses.extend(self._matching_metric_rules(analysis.metrics, self._ABSOLUTE_WEAKNESS_RULES))
         
         return weaknesses
     
@@ -1251,49 +1707,50 @@ class DecisionMakingEngine:
         route: Route,
         analysis: RouteAnalysis,
         all_routes: List[Route],
-        all_analyses: List[RouteAnalysis]
+        all_analyses: List[RouteAnalysis],
+        stats: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, str]]:
         """Generate specific trade-off descriptions for this route."""
         tradeoffs = []
         
-        other_analyses = [a for r, a in zip(all_routes, all_analyses) if r.id != route.id]
+        others = self._other_route_stats(route, all_routes, all_analyses, stats)
         
-        if not other_analyses:
+        if others is None:
             return tradeoffs
         
-        # Find best alternative in each category
-        best_time_analysis = min(other_analyses, key=lambda a: a.time_analysis.estimated_time)
-        best_cost_analysis = min(other_analyses, key=lambda a: a.cost_analysis.total_cost)
-        best_stress_analysis = min(other_analyses, key=lambda a: a.stress_analysis.overall_stress)
-        best_reliability_analysis = max(other_analyses, key=lambda a: a.reliability_analysis.overall_reliability)
+        # Best alternatives for time and cost, read as metric tuples
+        other_time, other_cost, _, _ = others
+        time, cost, stress, reliability = analysis.metrics
+        best_time, best_time_cost, best_time_stress, _ = all_analyses[other_time.min_index].metrics
+        best_cost_time, best_cost, _, best_cost_reliability = all_analyses[other_cost.min_index].metrics
         
         # Time trade-offs
-        if analysis.time_analysis.estimated_time > best_time_analysis.time_analysis.estimated_time:
-            time_diff = analysis.time_analysis.estimated_time - best_time_analysis.time_analysis.estimated_time
-            if analysis.cost_analysis.total_cost < best_time_analysis.cost_analysis.total_cost:
-                cost_savings = best_time_analysis.cost_analysis.total_cost - analysis.cost_analysis.total_cost
+        if time > best_time:
+            time_diff = time - best_time
+            if cost < best_time_cost:
+                cost_savings = best_time_cost - cost
                 tradeoffs.append({
                     "type": "time_vs_cost",
                     "description": f"Takes {time_diff} minutes longer but saves ${cost_savings:.2f}"
                 })
-            elif analysis.stress_analysis.overall_stress < best_time_analysis.stress_analysis.overall_stress:
-                stress_reduction = best_time_analysis.stress_analysis.overall_stress - analysis.stress_analysis.overall_stress
+            elif stress < best_time_stress:
+                stress_reduction = best_time_stress - stress
                 tradeoffs.append({
                     "type": "time_vs_stress",
                     "description": f"Takes {time_diff} minutes longer but reduces stress by {stress_reduction} points"
                 })
         
         # Cost trade-offs
-        if analysis.cost_analysis.total_cost > best_cost_analysis.cost_analysis.total_cost:
-            cost_diff = analysis.cost_analysis.total_cost - best_cost_analysis.cost_analysis.total_cost
-            if analysis.time_analysis.estimated_time < best_cost_analysis.time_analysis.estimated_time:
-                time_savings = best_cost_analysis.time_analysis.estimated_time - analysis.time_analysis.estimated_time
+        if cost > best_cost:
+            cost_diff = cost - best_cost
+            if time < best_cost_time:
+                time_savings = best_cost_time - time
                 tradeoffs.append({
                     "type": "cost_vs_time",
                     "description": f"Costs ${cost_diff:.2f} more but saves {time_savings} minutes"
                 })
-            elif analysis.reliability_analysis.overall_reliability > best_cost_analysis.reliability_analysis.overall_reliability:
-                reliability_gain = analysis.reliability_analysis.overall_reliability - best_cost_analysis.reliability_analysis.overall_reliability
+            elif reliability > best_cost_reliability:
+                reliability_gain = reliability - best_cost_reliability
                 tradeoffs.append({
                     "type": "cost_vs_reliability",
                     "description": f"Costs ${cost_diff:.2f} more but is {reliability_gain} points more reliable"
@@ -1335,15 +1792,15 @@ class DecisionMakingEngine:
             guidance.append("When you can't afford unexpected delays")
         
         # Mode-specific guidance
-        from commute_optimizer.models import TransportationMode
+        modes = set(route.transportation_modes)
         
-        if TransportationMode.CYCLING in route.transportation_modes:
+        if TransportationMode.CYCLING in modes:
             guidance.append("When weather is nice and you want exercise")
         
-        if TransportationMode.PUBLIC_TRANSIT in route.transportation_modes:
+        if TransportationMode.PUBLIC_TRANSIT in modes:
             guidance.append("When you want to relax or work during the commute")
         
-        if TransportationMode.DRIVING in route.transportation_modes:
+        if TransportationMode.DRIVING in modes:
             guidance.append("When you need maximum flexibility and control")
         
         return guidance
@@ -1353,71 +1810,71 @@ class DecisionMakingEngine:
         route: Route,
         analysis: RouteAnalysis,
         all_routes: List[Route],
-        all_analyses: List[RouteAnalysis]
+        all_analyses: List[RouteAnalysis],
+        stats: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, str]]:
         """Generate key comparison highlights for this route."""
         highlights = []
         
-        other_analyses = [a for r, a in zip(all_routes, all_analyses) if r.id != route.id]
+        others = self._other_route_stats(route, all_routes, all_analyses, stats)
         
-        if not other_analyses:
+        if others is None:
             return highlights
         
+        other_time, other_cost, other_stress, other_reliability = others
+        time, cost, stress, reliability = analysis.metrics
+        
         # Time comparison
-        other_times = [a.time_analysis.estimated_time for a in other_analyses]
-        min_time, max_time = min(other_times), max(other_times)
+        min_time, max_time = other_time.minimum, other_time.maximum
         
-        if analysis.time_analysis.estimated_time == min_time:
+        if time == min_time:
             highlights.append({
                 "category": "time",
                 "highlight": f"Fastest route - saves up to {max_time - min_time} minutes"
             })
-        elif analysis.time_analysis.estimated_time == max_time:
+        elif time == max_time:
             highlights.append({
                 "category": "time",
                 "highlight": f"Slowest route - takes {max_time - min_time} minutes longer"
             })
         
         # Cost comparison
-        other_costs = [a.cost_analysis.total_cost for a in other_analyses]
-        min_cost, max_cost = min(other_costs), max(other_costs)
+        min_cost, max_cost = other_cost.minimum, other_cost.maximum
         
-        if analysis.cost_analysis.total_cost == min_cost:
+        if cost == min_cost:
             highlights.append({
                 "category": "cost",
                 "highlight": f"Cheapest route - saves up to ${max_cost - min_cost:.2f}"
             })
-        elif analysis.cost_analysis.total_cost == max_cost:
+        elif cost == max_cost:
             highlights.append({
                 "category": "cost",
                 "highlight": f"Most expensive - costs ${max_cost - min_cost:.2f} more"
             })
         
         # Stress comparison
-        other_stress = [a.stress_analysis.overall_stress for a in other_analyses]
-        min_stress, max_stress = min(other_stress), max(other_stress)
+        min_stress, max_stress = other_stress.minimum, other_stress.maximum
         
-        if analysis.stress_analysis.overall_stress == min_stress:
+        if stress == min_stress:
             highlights.append({
                 "category": "stress",
                 "highlight": "Least stressful option"
             })
-        elif analysis.stress_analysis.overall_stress == max_stress:
+        elif stress == max_stress:
             highlights.append({
                 "category": "stress",
                 "highlight": "Most stressful option"
             })
         
         # Reliability comparison
-        other_reliability = [a.reliability_analysis.overall_reliability for a in other_analyses]
-        min_reliability, max_reliability = min(other_reliability), max(other_reliability)
+        min_reliability, max_reliability = other_reliability.minimum, other_reliability.maximum
         
-        if analysis.reliability_analysis.overall_reliability == max_reliability:
+        if reliability == max_reliability:
             highlights.append({
                 "category": "reliability",
                 "highlight": "Most reliable timing"
             })
-        elif analysis.reliability_analysis.overall_reliability == min_reliability:
+        elif reliability == min_reliability:
             highlights.append({
                 "category": "reliability",
                 "highlight": "Least reliable timing"
@@ -1428,22 +1885,20 @@ class DecisionMakingEngine:
     def _generate_overall_tradeoff_summary(
         self,
         routes: List[Route],
-        route_analyses: List[RouteAnalysis]
+        route_analyses: List[RouteAnalysis],
+        stats: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate an overall summary of trade-offs across all routes."""
         if len(routes) < 2:
             return "Only one route available - no trade-offs to consider."
         
         # Find extremes in each category
-        times = [a.time_analysis.estimated_time for a in route_analyses]
-        costs = [a.cost_analysis.total_cost for a in route_analyses]
-        stress_levels = [a.stress_analysis.overall_stress for a in route_analyses]
-        reliability_scores = [a.reliability_analysis.overall_reliability for a in route_analyses]
-        
-        time_range = max(times) - min(times)
-        cost_range = max(costs) - min(costs)
-        stress_range = max(stress_levels) - min(stress_levels)
-        reliability_range = max(reliability_scores) - min(reliability_scores)
+        if stats is None:
+            stats = self._metric_stats(routes, route_analyses)
+        time_range, cost_range, stress_range, reliability_range = (
+            column[highest[0]] - column[lowest[0]]
+            for column, lowest, highest in zip(stats["columns"], stats["lowest"], stats["highest"])
+        )
         
         summary_parts = []
         
@@ -1467,7 +1922,8 @@ class DecisionMakingEngine:
     def _generate_decision_guidance(
         self,
         routes: List[Route],
-        route_analyses: List[RouteAnalysis]
+        route_analyses: List[RouteAnalysis],
+        stats: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, str]]:
         """Generate decision guidance based on different scenarios."""
         guidance = []
@@ -1475,15 +1931,14 @@ class DecisionMakingEngine:
         if len(routes) < 2:
             return guidance
         
-        # Find best route for each criterion
-        fastest_idx = min(range(len(route_analyses)), 
-                         key=lambda i: route_analyses[i].time_analysis.estimated_time)
-        cheapest_idx = min(range(len(route_analyses)), 
-                          key=lambda i: route_analyses[i].cost_analysis.total_cost)
-        least_stressful_idx = min(range(len(route_analyses)), 
-                                 key=lambda i: route_analyses[i].stress_analysis.overall_stress)
-        most_reliable_idx = max(range(len(route_analyses)), 
-                               key=lambda i: route_analyses[i].reliability_analysis.overall_reliability)
+        # Find best route for each criterion (earliest route first on ties)
+        if stats is None:
+            stats = self._metric_stats(routes, route_analyses)
+        lowest, highest = stats["lowest"], stats["highest"]
+        fastest_idx = lowest[0][0]
+        cheapest_idx = lowest[1][0]
+        least_stressful_idx = lowest[2][0]
+        most_reliable_idx = highest[3][0]
         
         guidance.append({
             "scenario": "When time is most important",
@@ -1516,40 +1971,46 @@ class DecisionMakingEngine:
         matrix = []
         
         for i, (route, analysis) in enumerate(zip(routes, route_analyses)):
+            # Resolve each sub-analysis once rather than per field
+            time = analysis.time_analysis
+            cost = analysis.cost_analysis
+            stress = analysis.stress_analysis
+            reliability = analysis.reliability_analysis
+            
             route_data = {
                 'route_id': route.id,
                 'route_name': f"Route {i + 1}",
                 'transportation_modes': [mode.value for mode in route.transportation_modes],
                 'metrics': {
                     'time': {
-                        'estimated_minutes': analysis.time_analysis.estimated_time,
-                        'range_min': analysis.time_analysis.time_range_min,
-                        'range_max': analysis.time_analysis.time_range_max,
-                        'peak_impact': analysis.time_analysis.peak_hour_impact,
-                        'display': f"{analysis.time_analysis.estimated_time} min ({analysis.time_analysis.time_range_min}-{analysis.time_analysis.time_range_max})"
+                        'estimated_minutes': time.estimated_time,
+                        'range_min': time.time_range_min,
+                        'range_max': time.time_range_max,
+                        'peak_impact': time.peak_hour_impact,
+                        'display': f"{time.estimated_time} min ({time.time_range_min}-{time.time_range_max})"
                     },
                     'cost': {
-                        'total': analysis.cost_analysis.total_cost,
-                        'fuel': analysis.cost_analysis.fuel_cost,
-                        'transit': analysis.cost_analysis.transit_fare,
-                        'parking': analysis.cost_analysis.parking_cost,
-                        'tolls': analysis.cost_analysis.toll_cost,
-                        'display': f"${analysis.cost_analysis.total_cost:.2f}"
+                        'total': cost.total_cost,
+                        'fuel': cost.fuel_cost,
+                        'transit': cost.transit_fare,
+                        'parking': cost.parking_cost,
+                        'tolls': cost.toll_cost,
+                        'display': f"${cost.total_cost:.2f}"
                     },
                     'stress': {
-                        'overall': analysis.stress_analysis.overall_stress,
-                        'traffic': analysis.stress_analysis.traffic_stress,
-                        'complexity': analysis.stress_analysis.complexity_stress,
-                        'weather': analysis.stress_analysis.weather_stress,
-                        'display': f"{analysis.stress_analysis.overall_stress}/10"
+                        'overall': stress.overall_stress,
+                        'traffic': stress.traffic_stress,
+                        'complexity': stress.complexity_stress,
+                        'weather': stress.weather_stress,
+                        'display': f"{stress.overall_stress}/10"
                     },
                     'reliability': {
-                        'overall': analysis.reliability_analysis.overall_reliability,
-                        'variance': analysis.reliability_analysis.historical_variance,
-                        'incident_probability': analysis.reliability_analysis.incident_probability,
-                        'weather_impact': analysis.reliability_analysis.weather_impact,
-                        'service_reliability': analysis.reliability_analysis.service_reliability,
-                        'display': f"{analysis.reliability_analysis.overall_reliability}/10"
+                        'overall': reliability.overall_reliability,
+                        'variance': reliability.historical_variance,
+                        'incident_probability': reliability.incident_probability,
+                        'weather_impact': reliability.weather_impact,
+                        'service_reliability': reliability.service_reliability,
+                        'display': f"{reliability.overall_reliability}/10"
                     }
                 }
             }
@@ -1604,7 +2065,7 @@ class DecisionMakingEngine:
                 })
         
         # Weather uncertainty
-        weather_data = context.get('weather_data', {})
+        weather_data = context.get('weather_data') or _EMPTY
         if weather_data.get('forecast_confidence', 1.0) < 0.8:
             uncertainty_factors.append({
                 "factor": "Weather Forecast",
@@ -1612,24 +2073,30 @@ class DecisionMakingEngine:
                 "impact": "low"
             })
         
-        # High variance routes
+        # High variance and incident-prone routes, found in one pass but reported
+        # variance first
+        variance_factors = []
+        incident_factors = []
         for i, analysis in enumerate(route_analyses):
-            if analysis.reliability_analysis.historical_variance > 15:
-                uncertainty_factors.append({
+            reliability = analysis.reliability_analysis
+            
+            if reliability.historical_variance > 15:
+                variance_factors.append({
                     "factor": f"Route {i + 1} Timing Variance",
-                    "description": f"This route has high timing variance ({analysis.reliability_analysis.historical_variance:.1f} min)",
+                    "description": f"This route has high timing variance ({reliability.historical_variance:.1f} min)",
                     "impact": "high"
                 })
-        
-        # Incident probability
-        for i, analysis in enumerate(route_analyses):
-            if analysis.reliability_analysis.incident_probability > 0.3:
-                uncertainty_factors.append({
+            
+            if reliability.incident_probability > 0.3:
+                incident_factors.append({
                     "factor": f"Route {i + 1} Incident Risk",
-                    "description": f"High probability ({analysis.reliability_analysis.incident_probability:.1%}) of incidents",
+                    "description": f"High probability ({reliability.incident_probability:.1%}) of incidents",
                     "impact": "high"
                 })
         
+        uncertainty_factors.extend(variance_factors)
+        uncertainty_factors.extend(incident_factors)
+        
         return uncertainty_factors
     
     def _list_decision_assumptions(
@@ -1639,8 +2106,6 @@ class DecisionMakingEngine:
         context: Dict[str, Any]
     ) -> List[str]:
         """List key assumptions made in the decision process."""
-        from commute_optimizer.models import TransportationMode
-        
         assumptions = [
             "Traffic patterns follow historical trends",
             "Weather conditions remain as forecasted",
@@ -1653,10 +2118,13 @@ class DecisionMakingEngine:
         if context.get('special_events'):
             assumptions.append("Special events do not significantly impact traffic")
         
-        if any(TransportationMode.PUBLIC_TRANSIT in route.transportation_modes for route in routes):
+        # Collect every mode in use once rather than rescanning the routes per check
+        modes_present = set().union(*(route.transportation_modes for route in routes))
+        
+        if TransportationMode.PUBLIC_TRANSIT in modes_present:
             assumptions.append("Transit service disruptions are accounted for in reliability scores")
         
-        if any(TransportationMode.CYCLING in route.transportation_modes for route in routes):
+        if TransportationMode.CYCLING in modes_present:
             assumptions.append("Cyclist follows traffic laws and uses designated bike infrastructure")
         
         return assumptions
@@ -1668,38 +2136,58 @@ class DecisionMakingEngine:
         preferences: PreferenceProfile
     ) -> Dict[str, Dict[str, float]]:
         """Calculate detailed score breakdown for transparency."""
-        # Normalize scores to 0-1 scale (higher is better)
-        time_score = max(0, 1 - (analysis.time_analysis.estimated_time / 120))
-        cost_score = max(0, 1 - (analysis.cost_analysis.total_cost / 20))
-        comfort_score = (10 - analysis.stress_analysis.overall_stress) / 9
-        reliability_score = (analysis.reliability_analysis.overall_reliability - 1) / 9
+        return self._score_and_breakdown(route, analysis, preferences)[1]
+    
+    def _score_and_breakdown(
+        self,
+        route: Route,
+        analysis: RouteAnalysis,
+        preferences: PreferenceProfile
+    ) -> Tuple[float, Dict[str, Dict[str, float]]]:
+        """Calculate the weighted score and its detailed breakdown from one metrics read."""
+        return self._score_all_routes([analysis], preferences)[0]
+    
+    def _score_all_routes(
+        self,
+        route_analyses: List[RouteAnalysis],
+        preferences: PreferenceProfile
+    ) -> List[Tuple[float, Dict[str, Dict[str, float]]]]:
+        """
+        Calculate (weighted score, breakdown) for every route in one batch.
         
-        return {
-            "time": {
-                "raw_score": time_score,
-                "weight": preferences.time_weight / 100,
-                "weighted_score": time_score * preferences.time_weight / 100,
-                "explanation": f"Based on {analysis.time_analysis.estimated_time} minute travel time"
-            },
-            "cost": {
-                "raw_score": cost_score,
-                "weight": preferences.cost_weight / 100,
-                "weighted_score": cost_score * preferences.cost_weight / 100,
-                "explanation": f"Based on ${analysis.cost_analysis.total_cost:.2f} total cost"
-            },
-            "comfort": {
-                "raw_score": comfort_score,
-                "weight": preferences.comfort_weight / 100,
-                "weighted_score": comfort_score * preferences.comfort_weight / 100,
-                "explanation": f"Based on {analysis.stress_analysis.overall_stress}/10 stress level"
-            },
-            "reliability": {
-                "raw_score": reliability_score,
-                "weight": preferences.reliability_weight / 100,
-                "weighted_score": reliability_score * preferences.reliability_weight / 100,
-                "explanation": f"Based on {analysis.reliability_analysis.overall_reliability}/10 reliability score"
+        Weights are resolved once and the totals go through _score_metrics, so
+        large batches take its column-wise scoring path.
+        """
+        metrics = self._extract_metrics(route_analyses)
+        weights = self._preference_weights(preferences)
+        scores = self._score_metrics(metrics, weights)
+        
+        results = []
+        for score, (time, cost, stress, reliability) in zip(scores, metrics):
+            explanations = (
+                f"Based on {time} minute travel time",
+                f"Based on ${cost:.2f} total cost",
+                f"Based on {stress}/10 stress level",
+                f"Based on {reliability}/10 reliability score"
+            )
+            # Normalized scores (0-1, higher is better) are shared with the ranking pass
+            breakdown = {
+                criterion: {
+                    "raw_score": raw_score,
+                    "weight": weight / 100,
+                    "weighted_score": raw_score * weight / 100,
+                    "explanation": explanation
+                }
+                for criterion, raw_score, weight, explanation in zip(
+                    _BREAKDOWN_CRITERIA,
+                    _normalized_scores(time, cost, stress, reliability),
+                    weights,
+                    explanations
+                )
             }
-        }
+            results.append((score, breakdown))
+        
+        return results
     
     def _explain_score_calculation(
         self,
@@ -1708,14 +2196,16 @@ class DecisionMakingEngine:
     ) -> str:
         """Explain how the total score was calculated."""
         explanations = []
+        total_score = 0
         
+        # Format each term and accumulate the total in the same pass
         for criterion, data in breakdown.items():
+            weighted_score = data['weighted_score']
+            total_score += weighted_score
             explanations.append(
-                f"{criterion.title()}: {data['raw_score']:.3f} × {data['weight']:.2f} = {data['weighted_score']:.3f}"
+                f"{criterion.title()}: {data['raw_score']:.3f} × {data['weight']:.2f} = {weighted_score:.3f}"
             )
         
-        total_score = sum(data['weighted_score'] for data in breakdown.values())
-        
         return f"Total Score = {' + '.join(explanations)} = {total_score:.3f}"
     
     def validate_language_compliance(
@@ -1747,6 +2237,11 @@ class DecisionMakingEngine:
             "superlatives_without_explanation": []
         }
         
+        # Most internal text is already compliant; skip the individual checks
+        # when the cached scan found nothing at all
+        if _scan_language(text) == _NO_LANGUAGE_FINDINGS:
+            return validation_result
+        
         # Check for forbidden terms without explanation
         forbidden_violations = self._check_forbidden_terms(text)
         if forbidden_violations:
@@ -1794,13 +2289,12 @@ class DecisionMakingEngine:
             explanation_context = {}
         
         corrected_text = text
+        corrected_lower = text.lower()
         changes_made = []
         
         # Replace forbidden terms with compliant alternatives
-        forbidden_replacements = self._get_forbidden_term_replacements()
-        
-        for forbidden_term, replacement_info in forbidden_replacements.items():
-            if self._term_appears_without_explanation(corrected_text, forbidden_term):
+        for forbidden_term, replacement_info in self._forbidden_term_replacements.items():
+            if self._term_appears_without_explanation(corrected_text, forbidden_term, corrected_lower):
                 # Replace with explanation-based alternative
                 replacement = replacement_info["replacement"]
                 if explanation_context:
@@ -1809,6 +2303,7 @@ class DecisionMakingEngine:
                 corrected_text = self._replace_term_with_explanation(
                     corrected_text, forbidden_term, replacement
                 )
+                corrected_lower = corrected_text.lower()
                 
                 changes_made.append({
                     "original_term": forbidden_term,
@@ -1867,11 +2362,13 @@ class DecisionMakingEngine:
         # Avoid "best" or "optimal" - use explanation-based language
         recommendation_parts.append(f"Based on your preferences, this route offers:")
         
-        # Add specific strengths with explanations
+        # Add specific strengths with explanations, comparing against every option
+        compared_routes = [alt_route for alt_route, _ in alternatives]
+        compared_routes.append(route)
+        compared_analyses = [alt_analysis for _, alt_analysis in alternatives]
+        compared_analyses.append(analysis)
         strengths = self._identify_route_strengths(
-            route, analysis, 
-            [alt_route for alt_route, _ in alternatives] + [route],
-            [alt_analysis for _, alt_analysis in alternatives] + [analysis]
+            route, analysis, compared_routes, compared_analyses
         )
         
         for strength in strengths[:3]:  # Limit to top 3 strengths
@@ -1908,151 +2405,68 @@ class DecisionMakingEngine:
     
     def _check_forbidden_terms(self, text: str) -> List[Dict[str, str]]:
         """Check for forbidden terms used without proper explanation."""
-        violations = []
-        
-        # Define forbidden terms and their contexts
-        forbidden_terms = {
-            "best": ["best route", "best option", "best choice", "the best"],
-            "optimal": ["optimal route", "optimal choice", "optimal solution", "the optimal"],
-            "perfect": ["perfect route", "perfect choice", "perfect option", "the perfect"],
-            "ideal": ["ideal route", "ideal choice", "ideal option", "the ideal"],
-            "recommended": ["recommended route", "recommended option", "is recommended"],
-            "should": ["you should take", "you should choose"],
-            "must": ["you must take", "you must choose"]
-        }
-        
-        text_lower = text.lower()
-        
-        for base_term, variations in forbidden_terms.items():
-            for variation in variations:
-                if variation in text_lower:
-                    # Check if there's an explanation nearby
-                    if not self._has_nearby_explanation(text, variation):
-                        violations.append({
-                            "term": variation,
-                            "type": "forbidden_without_explanation",
-                            "message": f"'{variation}' used without explanation of criteria"
-                        })
-        
-        return violations
+        return [
+            {
+                "term": variation,
+                "type": "forbidden_without_explanation",
+                "message": f"'{variation}' used without explanation of criteria"
+            }
+            for variation in _scan_language(text).forbidden_terms
+        ]
     
     def _check_superlatives_without_explanation(self, text: str) -> List[Dict[str, str]]:
         """Check for superlative claims without explanation."""
-        violations = []
-        
-        superlative_patterns = [
-            "fastest", "slowest", "cheapest", "most expensive",
-            "most reliable", "least reliable", "most stressful", "least stressful",
-            "highest", "lowest", "maximum", "minimum",
-            "always", "never", "guaranteed", "certain"
+        return [
+            {
+                "term": superlative,
+                "type": "superlative_without_explanation",
+                "message": f"'{superlative}' claim needs explanation or comparison"
+            }
+            for superlative in _scan_language(text).superlatives
         ]
-        
-        text_lower = text.lower()
-        
-        for superlative in superlative_patterns:
-            if superlative in text_lower:
-                # Check if there's an explanation or comparison nearby
-                if not self._has_nearby_explanation_or_comparison(text, superlative):
-                    violations.append({
-                        "term": superlative,
-                        "type": "superlative_without_explanation",
-                        "message": f"'{superlative}' claim needs explanation or comparison"
-                    })
-        
-        return violations
     
     def _check_for_language_warnings(self, text: str) -> List[Dict[str, str]]:
         """Check for potentially problematic language that should be reviewed."""
-        warnings = []
-        
-        warning_terms = {
-            "obviously": "May sound condescending - consider removing",
-            "clearly": "May sound condescending - consider 'this shows' instead",
-            "definitely": "Consider 'likely' or 'typically' for more accurate language",
-            "absolutely": "Consider more nuanced language",
-            "impossible": "Consider 'very difficult' or 'not recommended'",
-            "terrible": "Consider more specific, constructive language",
-            "awful": "Consider more specific, constructive language",
-            "horrible": "Consider more specific, constructive language"
-        }
-        
-        text_lower = text.lower()
-        
-        for term, suggestion in warning_terms.items():
-            if term in text_lower:
-                warnings.append({
-                    "term": term,
-                    "type": "language_warning",
-                    "suggestion": suggestion
-                })
-        
-        return warnings
+        return [
+            {
+                "term": term,
+                "type": "language_warning",
+                "suggestion": _LANGUAGE_WARNING_TERMS[term]
+            }
+            for term in _scan_language(text).warning_terms
+        ]
     
     def _has_nearby_explanation(self, text: str, term: str) -> bool:
         """Check if there's an explanation near the forbidden term."""
-        # Find the position of the term
-        text_lower = text.lower()
-        term_pos = text_lower.find(term.lower())
-        
-        if term_pos == -1:
-            return False
-        
-        # Look for explanation keywords within 100 characters
-        explanation_keywords = [
-            "because", "since", "due to", "based on", "given that",
-            "considering", "factors", "criteria", "reasons", "analysis"
-        ]
-        
-        # Check text around the term (50 chars before and after)
-        start_pos = max(0, term_pos - 50)
-        end_pos = min(len(text), term_pos + len(term) + 50)
-        surrounding_text = text[start_pos:end_pos].lower()
-        
-        return any(keyword in surrounding_text for keyword in explanation_keywords)
+        return _has_nearby_keyword(text, term, _EXPLANATION_KEYWORDS)
     
     def _has_nearby_explanation_or_comparison(self, text: str, term: str) -> bool:
         """Check if there's an explanation or comparison near the superlative."""
-        # First check for explanation
-        if self._has_nearby_explanation(text, term):
-            return True
-        
-        # Then check for comparison keywords
-        text_lower = text.lower()
-        term_pos = text_lower.find(term.lower())
-        
-        if term_pos == -1:
-            return False
-        
-        comparison_keywords = [
-            "compared to", "versus", "than", "relative to",
-            "among", "between", "of all", "in comparison"
-        ]
-        
-        # Check text around the term
-        start_pos = max(0, term_pos - 50)
-        end_pos = min(len(text), term_pos + len(term) + 50)
-        surrounding_text = text[start_pos:end_pos].lower()
-        
-        return any(keyword in surrounding_text for keyword in comparison_keywords)
+        return _has_nearby_keyword(text, term, _EXPLANATION_OR_COMPARISON_KEYWORDS)
+    
+    @cached_property
+    def _forbidden_term_replacements(self) -> Dict[str, Dict[str, Any]]:
+        """Replacement patterns for forbidden terms, built once per engine."""
+        return self._get_forbidden_term_replacements()
     
     def _get_forbidden_term_replacements(self) -> Dict[str, Dict[str, Any]]:
         """Get replacement patterns for forbidden terms."""
         return {
             "best": {
                 "replacement": "highest-scoring based on your preferences",
-                "contextual_replacement": lambda ctx: f"highest-scoring for {self._get_preference_context(ctx)}"
+                "contextual_replacement": partial(_best_in_context, self)
             },
             "optimal": {
                 "replacement": "most suitable based on analysis",
-                "contextual_replacement": lambda ctx: f"most suitable given {self._get_analysis_context(ctx)}"
+                "contextual_replacement": partial(_optimal_in_context, self)
             },
             "perfect": {
                 "replacement": "well-suited",
-                "contextual_replacement": lambda ctx: "well-suited for your stated priorities"
+                "contextual_replacement": partial(_perfect_in_context, self)
             },
             "recommended": {
                 "replacement": "suggested based on your preferences",
-                "contextual_replacement": lambda ctx: f"suggested because {self._get_reasoning_context(ctx)}"
+                "contextual_replacement": partial(_recommended_in_context, self)
             }
         }
     
@@ -2093,42 +2507,44 @@ class DecisionMakingEngine:
             return context["reasoning"]
         return "it matches your priorities"
     
-    def _term_appears_without_explanation(self, text: str, term: str) -> bool:
+    def _term_appears_without_explanation(
+        self,
+        text: str,
+        term: str,
+        text_lower: Optional[str] = None
+    ) -> bool:
         """Check if a term appears without explanation."""
-        return term.lower() in text.lower() and not self._has_nearby_explanation(text, term)
+        if text_lower is None:
+            text_lower = text.lower()
+        term_pos = text_lower.find(term.lower())
+        return term_pos != -1 and not _keyword_near(
+            text_lower, term_pos, len(term), _EXPLANATION_KEYWORDS
+        )
     
     def _replace_term_with_explanation(self, text: str, term: str, replacement: str) -> str:
         """Replace a term with an explanation-based alternative."""
-        # Case-insensitive replacement while preserving original case pattern
-        import re
+        # Case-insensitive replacement while preserving original case pattern;
+        # the recased replacements are built once rather than per match
+        upper_replacement = replacement.upper()
+        title_replacement = replacement.title()
         
         def replace_func(match):
             original = match.group(0)
             if original.isupper():
-                return replacement.upper()
+                return upper_replacement
             elif original.istitle():
-                return replacement.title()
+                return title_replacement
             else:
                 return replacement
         
-        pattern = re.compile(re.escape(term), re.IGNORECASE)
-        return pattern.sub(replace_func, text)
+        return _term_pattern(term).sub(replace_func, text)
     
     def _find_superlatives_without_explanation(self, text: str) -> List[str]:
         """Find superlatives that lack explanation."""
-        superlatives = []
-        
-        superlative_patterns = [
-            "fastest", "slowest", "cheapest", "most expensive",
-            "most reliable", "least reliable", "most stressful", "least stressful"
+        return [
+            superlative for superlative in _scan_language(text).superlatives
+            if superlative in _CORRECTABLE_SUPERLATIVES
         ]
-        
-        for superlative in superlative_patterns:
-            if (superlative in text.lower() and 
-                not self._has_nearby_explanation_or_comparison(text, superlative)):
-                superlatives.append(superlative)
-        
-        return superlatives
     
     def _generate_superlative_explanation(
         self, 
@@ -2136,18 +2552,7 @@ class DecisionMakingEngine:
         context: Dict[str, Any]
     ) -> str:
         """Generate an explanation for a superlative claim."""
-        explanations = {
-            "fastest": "compared to other available routes",
-            "slowest": "among the route options",
-            "cheapest": "of the available alternatives",
-            "most expensive": "compared to other routes",
-            "most reliable": "based on historical data",
-            "least reliable": "according to timing variance",
-            "most stressful": "due to traffic and complexity factors",
-            "least stressful": "with minimal traffic exposure"
-        }
-        
-        base_explanation = explanations.get(superlative, "based on analysis")
+        base_explanation = _SUPERLATIVE_EXPLANATIONS.get(superlative, "based on analysis")
         
         # Add context if available
         if "alternatives" in context and context["alternatives"]:
@@ -2163,15 +2568,12 @@ class DecisionMakingEngine:
         explanation: str
     ) -> str:
         """Add explanation to a superlative in the text."""
-        import re
-        
-        # Find the superlative and add explanation after it
-        pattern = re.compile(f"\\b{re.escape(superlative)}\\b", re.IGNORECASE)
-        
-        def replace_func(match):
-            return f"{match.group(0)} ({explanation})"
-        
-        return pattern.sub(replace_func, text, count=1)
+        # Find the superlative and add explanation after it; backslashes are the
+        # only special characters in a substitution template, so escaping them
+        # keeps the explanation literal without a per-match callback
+        literal_explanation = explanation.replace("\\", "\\\\")
+        template = f"\\g<0> ({literal_explanation})"
+        return _term_pattern(superlative, whole_word=True).sub(template, text, count=1)
     
     def _generate_language_suggestions(
         self, 
@@ -2198,11 +2600,6 @@ class DecisionMakingEngine:
         
         # General suggestions
         if violations:
-            suggestions.append(
-                "Focus on explaining the reasoning behind claims rather than making absolute statements"
-            )
-            suggestions.append(
-                "Provide context and criteria for any comparative or superlative statements"
-            )
+            suggestions.extend(_GENERAL_LANGUAGE_SUGGESTIONS)
         
         return suggestions
\ No newline at end of file
@@ -1,15 +1,272 @@
 """Route Analysis Service for evaluating routes across multiple criteria."""
 
+from itertools import combinations
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-import math
+from typing import Dict, Any, Optional, List, FrozenSet, Sequence, Tuple, Mapping
+from types import MappingProxyType
 
 from commute_optimizer.models import (
     Route, RouteAnalysis, TimeAnalysis, CostAnalysis, StressAnalysis, 
-    ReliabilityAnalysis, TradeoffSummary, ComparisonPoint, TransportationMode
+    ReliabilityAnalysis, TradeoffSummary, ComparisonPoint, TransportationMode,
+    RouteSegment
 )
 
 
+# Modes grouped by the conditions they are exposed to
+_TRAFFIC_MODES = frozenset({TransportationMode.DRIVING, TransportationMode.RIDESHARE})
+_VISIBILITY_SENSITIVE_MODES = frozenset({TransportationMode.DRIVING, TransportationMode.CYCLING})
+_EXPOSED_MODES = frozenset({TransportationMode.WALKING, TransportationMode.CYCLING})
+
+# Traffic stress multiplier by congestion level
+_CONGESTION_STRESS_MULTIPLIERS = MappingProxyType({
+    'light': 0.7,
+    'moderate': 1.0,
+    'heavy': 1.6,
+    'severe': 2.0
+})
+
+# Complexity stress added by parking availability
+_PARKING_STRESS_LEVELS = MappingProxyType({
+    'abundant': 0,
+    'moderate': 1,
+    'limited': 2,
+    'scarce': 3
+})
+
+# Weather stress by condition
+_WEATHER_STRESS_LEVELS = MappingProxyType({
+    'clear': 1,
+    'cloudy': 1,
+    'light_rain': 2,
+    'rain': 3,
+    'heavy_rain': 5,
+    'snow': 4,
+    'heavy_snow': 6,
+    'fog': 4,
+    'storm': 7,
+    'ice': 8
+})
+
+# Weather stress multiplier by transportation mode
+_MODE_WEATHER_STRESS_MULTIPLIERS = MappingProxyType({
+    TransportationMode.CYCLING: 2.0,  # Most vulnerable to weather
+    TransportationMode.WALKING: 1.8,  # Very vulnerable
+    TransportationMode.DRIVING: 1.2,  # Somewhat vulnerable
+    TransportationMode.RIDESHARE: 1.1,  # Slightly vulnerable (pickup/dropoff)
+    TransportationMode.PUBLIC_TRANSIT: 1.0  # Least vulnerable (covered)
+})
+
+# Historical travel-time variance (minutes) by transportation mode
+_MODE_VARIANCE_FACTORS = MappingProxyType({
+    TransportationMode.WALKING: 1.0,  # Very consistent
+    TransportationMode.CYCLING: 2.0,  # Weather dependent
+    TransportationMode.DRIVING: 4.0,  # Traffic dependent
+    TransportationMode.RIDESHARE: 5.0,  # Pickup time + traffic
+    TransportationMode.PUBLIC_TRANSIT: 6.0  # Schedule dependent
+})
+
+# Weather conditions that widen historical variance
+_HIGH_VARIANCE_WEATHER = frozenset({'rain', 'snow', 'fog', 'storm'})
+
+# Incident rate by transportation mode
+_MODE_INCIDENT_RATES = MappingProxyType({
+    TransportationMode.WALKING: 0.01,  # Very low incident rate
+    TransportationMode.CYCLING: 0.03,  # Low incident rate
+    TransportationMode.PUBLIC_TRANSIT: 0.08,  # Service disruptions
+    TransportationMode.RIDESHARE: 0.12,  # Traffic + pickup issues
+    TransportationMode.DRIVING: 0.15   # Highest incident rate
+})
+
+# Incident probability added by weather condition
+_WEATHER_INCIDENT_FACTORS = MappingProxyType({
+    'clear': 0.0,
+    'rain': 0.03,
+    'heavy_rain': 0.06,
+    'snow': 0.08,
+    'heavy_snow': 0.12,
+    'fog': 0.05,
+    'storm': 0.10,
+    'ice': 0.15
+})
+
+# Base reliability impact by weather condition
+_WEATHER_IMPACT_LEVELS = MappingProxyType({
+    'clear': 0.0,
+    'cloudy': 0.05,
+    'light_rain': 0.15,
+    'rain': 0.25,
+    'heavy_rain': 0.45,
+    'snow': 0.35,
+    'heavy_snow': 0.60,
+    'fog': 0.30,
+    'storm': 0.55,
+    'ice': 0.70
+})
+
+# Weather impact vulnerability by transportation mode
+_MODE_WEATHER_VULNERABILITY = MappingProxyType({
+    TransportationMode.PUBLIC_TRANSIT: 0.3,  # Least vulnerable (covered)
+    TransportationMode.RIDESHARE: 0.5,      # Pickup/dropoff exposure
+    TransportationMode.DRIVING: 0.7,        # Road condition dependent
+    TransportationMode.WALKING: 1.2,        # Very vulnerable
+    TransportationMode.CYCLING: 1.5         # Most vulnerable
+})
+
+# Transit reliability factor by service status
+_SERVICE_RELIABILITY_FACTORS = MappingProxyType({
+    'normal': 1.0,
+    'minor_delays': 0.9,
+    'delays': 0.75,
+    'major_delays': 0.6,
+    'disrupted': 0.4,
+    'suspended': 0.1,
+    'cancelled': 0.0
+})
+
+# Transit reliability factor by weather condition
+_WEATHER_SERVICE_IMPACT = MappingProxyType({
+    'clear': 1.0,
+    'rain': 0.95,
+    'heavy_rain': 0.85,
+    'snow': 0.8,
+    'heavy_snow': 0.6,
+    'storm': 0.7,
+    'ice': 0.5
+})
+
+
+def _max_by_mode_combination(
+    values: Mapping[TransportationMode, float]
+) -> Mapping[FrozenSet[TransportationMode], float]:
+    """Precompute the largest per-mode value for every combination of modes."""
+    modes = tuple(TransportationMode)
+    return MappingProxyType({
+        frozenset(combination): max(values[mode] for mode in combination)
+        for size in range(1, len(modes) + 1)
+        for combination in combinations(modes, size)
+    })
+
+
+# Worst-case per-mode factors for a route's set of modes
+_MAX_WEATHER_STRESS_MULTIPLIER = _max_by_mode_combination(_MODE_WEATHER_STRESS_MULTIPLIERS)
+_MAX_VARIANCE_FACTOR = _max_by_mode_combination(_MODE_VARIANCE_FACTORS)
+_MAX_INCIDENT_RATE = _max_by_mode_combination(_MODE_INCIDENT_RATES)
+_MAX_WEATHER_VULNERABILITY = _max_by_mode_combination(_MODE_WEATHER_VULNERABILITY)
+
+# Departure windows used by the time-of-day adjustments
+_PEAK = "peak"
+_NIGHT = "night"
+_REGULAR = "regular"
+
+
+def _departure_window(hour: int, peak_start: int) -> str:
+    """Classify a departure hour as peak, late night/early morning, or regular."""
+    if peak_start <= hour <= 9 or 17 <= hour <= 19:
+        return _PEAK
+    if 22 <= hour or hour <= 5:
+        return _NIGHT
+    return _REGULAR
+
+
+# Departure window by hour of day
+_DEPARTURE_WINDOWS = tuple(_departure_window(hour, peak_start=7) for hour in range(24))
+
+# Transit service peaks start an hour earlier than road traffic
+_TRANSIT_DEPARTURE_WINDOWS = tuple(_departure_window(hour, peak_start=6) for hour in range(24))
+
+# Historical travel-time variance (minutes) by departure window
+_DEPARTURE_WINDOW_VARIANCE = MappingProxyType({
+    _PEAK: 5.0,  # Higher variance during peak hours
+    _NIGHT: 2.0,  # Lower variance during off-peak
+    _REGULAR: 3.0  # Moderate variance during regular hours
+})
+
+# Incident probability added by departure window
+_DEPARTURE_WINDOW_INCIDENT_FACTORS = MappingProxyType({
+    _PEAK: 0.05,  # Higher incident probability during peak
+    _NIGHT: 0.02,  # Lower incident probability during off-peak
+    _REGULAR: 0
+})
+
+# Transit service reliability by departure window
+_DEPARTURE_WINDOW_SERVICE_RELIABILITY = MappingProxyType({
+    _PEAK: 0.9,  # Slightly less reliable during peak
+    _NIGHT: 0.7,  # Less reliable during off-peak hours
+    _REGULAR: 1.0
+})
+
+
+@dataclass(frozen=True)
+class _RouteProfile:
+    """Route facts shared by several analyzers, computed once per analysis."""
+    modes: FrozenSet[TransportationMode]
+    mode_count: int
+    segment_count: int
+    transit_segments: int
+    walking_distance: float
+    departure_window: str
+    transit_departure_window: str
+
+
+def _segment_totals(segments: Sequence[RouteSegment]) -> Tuple[int, float]:
+    """Count transit segments and total the walking distance in one pass."""
+    transit_segments = 0
+    walking_distance = 0
+    for segment in segments:
+        # Validated segments hold enum members, so identity checks avoid str.__eq__
+        mode = segment.mode
+        if mode is TransportationMode.PUBLIC_TRANSIT:
+            transit_segments += 1
+        elif mode is TransportationMode.WALKING:
+            walking_distance += segment.distance
+    return transit_segments, walking_distance
+
+
+def _profile_route(route: Route) -> _RouteProfile:
+    """Summarize the route's modes, segments and departure window for the analyzers."""
+    transit_segments, walking_distance = _segment_totals(route.segments)
+    departure_hour = route.departure_time.hour
+    return _RouteProfile(
+        modes=frozenset(route.transportation_modes),
+        mode_count=len(route.transportation_modes),
+        segment_count=len(route.segments),
+        transit_segments=transit_segments,
+        walking_distance=walking_distance,
+        departure_window=_DEPARTURE_WINDOWS[departure_hour],
+        transit_departure_window=_TRANSIT_DEPARTURE_WINDOWS[departure_hour]
+    )
+
+
+# Shared read-only stand-in for condition data that was not provided
+_EMPTY = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class _Conditions:
+    """Sections of the current conditions, extracted once per analysis."""
+    weather: Mapping[str, Any]
+    traffic: Mapping[str, Any]
+    transit: Mapping[str, Any]
+    parking: Mapping[str, Any]
+
+
+def _split_conditions(current_conditions: Dict[str, Any]) -> _Conditions:
+    """Pull the weather, traffic, transit and parking data out of the current conditions."""
+    return _Conditions(
+        weather=current_conditions.get('weather_data') or _EMPTY,
+        traffic=current_conditions.get('traffic_data') or _EMPTY,
+        transit=current_conditions.get('transit_data') or _EMPTY,
+        parking=current_conditions.get('parking_data') or _EMPTY
+    )
+
+
+def _clamp_score(value: float) -> int:
+    """Truncate a score to an integer on the 1-10 scale."""
+    score = int(value)
+    return 1 if score < 1 else 10 if score > 10 else score
+
+
 class RouteAnalysisService:
     """Service for analyzing routes across time, cost, stress, and reliability criteria."""
     
@@ -51,20 +308,65 @@ class RouteAnalysisService:
         if current_conditions is None:
             current_conditions = {}
         
+        return self._build_analysis(
+            route, current_conditions, _split_conditions(current_conditions), datetime.now()
+        )
+    
+    def analyze_routes(
+        self, 
+        routes: List[Route], 
+        current_conditions: Optional[Dict[str, Any]] = None
+    ) -> List[RouteAnalysis]:
+        """
+        Analyze several routes under the same current conditions.
+        
+        The conditions are split once for the whole batch instead of once
+        per route, which is the common case when comparing alternatives.
+        Every analysis in the batch carries the same timestamp.
+        
+        Args:
+            routes: Routes to analyze
+            current_conditions: Current traffic, weather, and transit conditions
+            
+        Returns:
+            Complete route analyses in the same order as the routes
+        """
+        if current_conditions is None:
+            current_conditions = {}
+        
+        conditions = _split_conditions(current_conditions)
+        timestamp = datetime.now()
+        return [
+            self._build_analysis(route, current_conditions, conditions, timestamp)
+            for route in routes
+        ]
+    
+    def _build_analysis(
+        self, 
+        route: Route, 
+        current_conditions: Dict[str, Any],
+        conditions: _Conditions,
+        timestamp: datetime
+    ) -> RouteAnalysis:
+        """Run every analyzer on the route and assemble the complete analysis."""
+        # Modes, segment totals and departure window are needed by several analyzers,
+        # so gather them once
+        profile = _profile_route(route)
+        
         # Perform analysis across all four criteria
-        time_analysis = self._analyze_time(route, current_conditions)
+        time_analysis = self._analyze_time(route, profile, conditions)
         cost_analysis = self.calculate_cost(route, current_conditions)
-        stress_analysis = self._analyze_stress(route, current_conditions)
-        reliability_analysis = self._analyze_reliability(route, current_conditions)
+        stress_analysis = self._analyze_stress(route, profile, conditions)
+        reliability_analysis = self._analyze_reliability(route, profile, conditions)
         
         # Generate trade-off summary
         tradeoff_summary = self._generate_tradeoff_summary(
-            route, time_analysis, cost_analysis, stress_analysis, reliability_analysis
+            route, profile, time_analysis, cost_analysis, stress_analysis, reliability_analysis
         )
         
         return RouteAnalysis(
             route_id=route.id,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             time_analysis=time_analysis,
             cost_analysis=cost_analysis,
             stress_analysis=stress_analysis,
@@ -100,8 +402,7 @@ class RouteAnalysisService:
         
         # Apply traffic adjustments for driving segments
         traffic_multiplier = 1.0
-        if any(mode in [TransportationMode.DRIVING, TransportationMode.RIDESHARE] 
-               for mode in route.transportation_modes):
+        if not _TRAFFIC_MODES.isdisjoint(route.transportation_modes):
             # Get traffic conditions
             congestion_level = traffic_data.get('congestion_level', 'moderate')
             if congestion_level == 'heavy':
@@ -191,25 +492,25 @@ class RouteAnalysisService:
     def _analyze_time(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> TimeAnalysis:
         """Analyze time-related aspects of the route."""
         base_time = self.calculate_travel_time(
             route, 
-            current_conditions.get('traffic_data'),
-            current_conditions.get('transit_data')
+            conditions.traffic,
+            conditions.transit
         )
         
-        # Calculate time range (best case to worst case)
-        time_variance = max(5, int(base_time * 0.2))  # 20% variance or 5 minutes minimum
-        time_range_min = max(int(base_time * 0.8), base_time - time_variance)
+        # Calculate time range (best case to worst case) in whole minutes
+        time_variance = max(5, base_time // 5)  # 20% variance or 5 minutes minimum
+        time_range_min = max(base_time * 4 // 5, base_time - time_variance)
         time_range_max = base_time + time_variance
         
         # Peak hour impact
-        departure_hour = route.departure_time.hour
         peak_hour_impact = 0
-        if 7 <= departure_hour <= 9 or 17 <= departure_hour <= 19:  # Peak hours
-            peak_hour_impact = max(5, int(base_time * 0.15))  # 15% increase during peak
+        if profile.departure_window == _PEAK:
+            peak_hour_impact = max(5, base_time * 3 // 20)  # 15% increase during peak
         
         return TimeAnalysis(
             estimated_time=base_time,
@@ -221,7 +522,8 @@ class RouteAnalysisService:
     def _analyze_stress(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> StressAnalysis:
         """
         Analyze stress-related aspects of the route.
@@ -232,13 +534,12 @@ class RouteAnalysisService:
         Validates: Requirements 2.1
         """
         # Calculate individual stress components
-        traffic_stress = self._calculate_traffic_stress(route, current_conditions)
-        complexity_stress = self._calculate_complexity_stress(route, current_conditions)
-        weather_stress = self._calculate_weather_stress(route, current_conditions)
+        traffic_stress = self._calculate_traffic_stress(route, profile, conditions)
+        complexity_stress = self._calculate_complexity_stress(route, profile, conditions)
+        weather_stress = self._calculate_weather_stress(route, profile, conditions)
         
         # Overall stress is weighted average of components
-        overall_stress = int((traffic_stress * 0.5 + complexity_stress * 0.3 + weather_stress * 0.2))
-        overall_stress = max(1, min(10, overall_stress))
+        overall_stress = _clamp_score(traffic_stress * 0.5 + complexity_stress * 0.3 + weather_stress * 0.2)
         
         return StressAnalysis(
             traffic_stress=traffic_stress,
@@ -250,7 +551,8 @@ class RouteAnalysisService:
     def _calculate_traffic_stress(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> int:
         """
         Calculate stress from traffic congestion patterns.
@@ -264,22 +566,14 @@ class RouteAnalysisService:
         base_stress = 3  # Base traffic stress level
         
         # Only apply traffic stress to driving/rideshare routes
-        if not any(mode in [TransportationMode.DRIVING, TransportationMode.RIDESHARE] 
-                  for mode in route.transportation_modes):
+        if _TRAFFIC_MODES.isdisjoint(profile.modes):
             return 1  # Minimal traffic stress for non-driving routes
         
-        traffic_conditions = current_conditions.get('traffic_data', {})
+        traffic_conditions = conditions.traffic
         congestion_level = traffic_conditions.get('congestion_level', 'moderate')
         
         # Congestion level impact
-        congestion_multipliers = {
-            'light': 0.7,
-            'moderate': 1.0,
-            'heavy': 1.6,
-            'severe': 2.0
-        }
-        
-        congestion_stress = base_stress * congestion_multipliers.get(congestion_level, 1.0)
+        congestion_stress = base_stress * _CONGESTION_STRESS_MULTIPLIERS.get(congestion_level, 1.0)
         
         # Stop-and-go pattern stress
         traffic_pattern = traffic_conditions.get('pattern', 'flowing')
@@ -289,8 +583,7 @@ class RouteAnalysisService:
             congestion_stress *= 1.1
         
         # Peak hour predictability stress
-        departure_hour = route.departure_time.hour
-        if 7 <= departure_hour <= 9 or 17 <= departure_hour <= 19:  # Peak hours
+        if profile.departure_window == _PEAK:
             # Peak hours are more stressful due to unpredictability
             congestion_stress *= 1.2
         
@@ -299,12 +592,13 @@ class RouteAnalysisService:
         if route.total_distance > 15:  # Likely highway route
             congestion_stress *= 1.1
         
-        return max(1, min(10, int(congestion_stress)))
+        return _clamp_score(congestion_stress)
     
     def _calculate_complexity_stress(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> int:
         """
         Calculate stress from route complexity.
@@ -318,51 +612,42 @@ class RouteAnalysisService:
         base_complexity = 2  # Base complexity stress
         
         # Mode change stress
-        num_modes = len(route.transportation_modes)
+        num_modes = profile.mode_count
         mode_change_stress = (num_modes - 1) * 1.5  # Each additional mode adds stress
         
         # Segment complexity stress
-        segment_stress = len(route.segments) * 0.3  # More segments = more navigation stress
+        segment_stress = profile.segment_count * 0.3  # More segments = more navigation stress
         
         # Transfer complexity for transit routes
         transfer_stress = 0
-        if TransportationMode.PUBLIC_TRANSIT in route.transportation_modes:
+        if TransportationMode.PUBLIC_TRANSIT in profile.modes:
             # Estimate transfers based on segments
-            transit_segments = sum(1 for seg in route.segments 
-                                 if seg.mode == TransportationMode.PUBLIC_TRANSIT)
-            if transit_segments > 1:
-                transfer_stress = (transit_segments - 1) * 2  # Each transfer adds stress
+            if profile.transit_segments > 1:
+                transfer_stress = (profile.transit_segments - 1) * 2  # Each transfer adds stress
         
         # Parking availability stress
         parking_stress = 0
-        if TransportationMode.DRIVING in route.transportation_modes:
-            parking_conditions = current_conditions.get('parking_data', {})
+        if TransportationMode.DRIVING in profile.modes:
+            parking_conditions = conditions.parking
             parking_availability = parking_conditions.get('availability', 'moderate')
-            
-            parking_stress_levels = {
-                'abundant': 0,
-                'moderate': 1,
-                'limited': 2,
-                'scarce': 3
-            }
-            parking_stress = parking_stress_levels.get(parking_availability, 1)
+            parking_stress = _PARKING_STRESS_LEVELS.get(parking_availability, 1)
         
         # Walking distance stress
         walking_stress = 0
-        total_walking_distance = sum(seg.distance for seg in route.segments 
-                                   if seg.mode == TransportationMode.WALKING)
+        total_walking_distance = profile.walking_distance
         if total_walking_distance > 1.0:  # More than 1km walking
             walking_stress = min(2, total_walking_distance - 1.0)  # Cap at 2 points
         
         total_complexity = (base_complexity + mode_change_stress + segment_stress + 
                           transfer_stress + parking_stress + walking_stress)
         
-        return max(1, min(10, int(total_complexity)))
+        return _clamp_score(total_complexity)
     
     def _calculate_weather_stress(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> int:
         """
         Calculate stress from weather conditions.
@@ -372,7 +657,7 @@ class RouteAnalysisService:
         - Transportation mode vulnerability to weather
         - Seasonal weather impact patterns
         """
-        weather_conditions = current_conditions.get('weather_data', {})
+        weather_conditions = conditions.weather
         weather_condition = weather_conditions.get('condition', 'clear')
         temperature = weather_conditions.get('temperature', 20)  # Celsius
         visibility = weather_conditions.get('visibility_km', 10)  # km
@@ -381,57 +666,33 @@ class RouteAnalysisService:
         base_weather_stress = 1
         
         # Weather condition impact
-        weather_stress_levels = {
-            'clear': 1,
-            'cloudy': 1,
-            'light_rain': 2,
-            'rain': 3,
-            'heavy_rain': 5,
-            'snow': 4,
-            'heavy_snow': 6,
-            'fog': 4,
-            'storm': 7,
-            'ice': 8
-        }
-        
-        condition_stress = weather_stress_levels.get(weather_condition, 2)
-        
-        # Transportation mode vulnerability
-        mode_weather_multipliers = {
-            TransportationMode.CYCLING: 2.0,  # Most vulnerable to weather
-            TransportationMode.WALKING: 1.8,  # Very vulnerable
-            TransportationMode.DRIVING: 1.2,  # Somewhat vulnerable
-            TransportationMode.RIDESHARE: 1.1,  # Slightly vulnerable (pickup/dropoff)
-            TransportationMode.PUBLIC_TRANSIT: 1.0  # Least vulnerable (covered)
-        }
-        
-        # Apply highest vulnerability multiplier from route's modes
-        max_multiplier = max(mode_weather_multipliers.get(mode, 1.0) 
-                           for mode in route.transportation_modes)
+        condition_stress = _WEATHER_STRESS_LEVELS.get(weather_condition, 2)
+        
+        # Transportation mode vulnerability: apply highest multiplier from route's modes
+        max_multiplier = _MAX_WEATHER_STRESS_MULTIPLIER[profile.modes]
         
         weather_stress = condition_stress * max_multiplier
         
         # Visibility impact (especially for driving/cycling)
-        if visibility < 5 and any(mode in [TransportationMode.DRIVING, TransportationMode.CYCLING] 
-                                 for mode in route.transportation_modes):
+        if visibility < 5 and not _VISIBILITY_SENSITIVE_MODES.isdisjoint(profile.modes):
             weather_stress *= 1.3
         
         # Temperature extremes (especially for walking/cycling)
-        if any(mode in [TransportationMode.WALKING, TransportationMode.CYCLING] 
-               for mode in route.transportation_modes):
+        if not _EXPOSED_MODES.isdisjoint(profile.modes):
             if temperature < -5 or temperature > 35:  # Extreme temperatures
                 weather_stress *= 1.2
         
         # High wind impact (especially for cycling)
-        if (wind_speed > 30 and TransportationMode.CYCLING in route.transportation_modes):
+        if (wind_speed > 30 and TransportationMode.CYCLING in profile.modes):
             weather_stress *= 1.4
         
-        return max(1, min(10, int(weather_stress)))
+        return _clamp_score(weather_stress)
     
     def _analyze_reliability(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> ReliabilityAnalysis:
         """
         Analyze reliability-related aspects of the route.
@@ -442,10 +703,10 @@ class RouteAnalysisService:
         Validates: Requirements 2.1
         """
         # Calculate individual reliability components
-        historical_variance = self._calculate_historical_variance(route, current_conditions)
-        incident_probability = self._calculate_incident_probability(route, current_conditions)
-        weather_impact = self._calculate_weather_impact(route, current_conditions)
-        service_reliability = self._calculate_service_reliability(route, current_conditions)
+        historical_variance = self._calculate_historical_variance(route, profile, conditions)
+        incident_probability = self._calculate_incident_probability(route, profile, conditions)
+        weather_impact = self._calculate_weather_impact(route, profile, conditions)
+        service_reliability = self._calculate_service_reliability(route, profile, conditions)
         
         # Calculate overall reliability score
         overall_reliability = self._calculate_overall_reliability(
@@ -463,7 +724,8 @@ class RouteAnalysisService:
     def _calculate_historical_variance(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> float:
         """
         Calculate historical variance in travel times.
@@ -477,53 +739,33 @@ class RouteAnalysisService:
         base_variance = 3.0  # 3 minutes base variance
         
         # Route complexity variance
-        complexity_variance = len(route.segments) * 1.2  # More segments = more variance
+        complexity_variance = profile.segment_count * 1.2  # More segments = more variance
         
         # Distance-based variance (longer routes have more variables)
         distance_variance = route.total_distance * 0.15  # 0.15 minutes per km
         
-        # Transportation mode variance
-        mode_variance = 0
-        mode_variance_factors = {
-            TransportationMode.WALKING: 1.0,  # Very consistent
-            TransportationMode.CYCLING: 2.0,  # Weather dependent
-            TransportationMode.DRIVING: 4.0,  # Traffic dependent
-            TransportationMode.RIDESHARE: 5.0,  # Pickup time + traffic
-            TransportationMode.PUBLIC_TRANSIT: 6.0  # Schedule dependent
-        }
-        
-        # Use maximum variance from all modes (worst case)
-        max_mode_variance = max(mode_variance_factors.get(mode, 3.0) 
-                               for mode in route.transportation_modes)
-        mode_variance = max_mode_variance
+        # Transportation mode variance: use maximum variance from all modes (worst case)
+        mode_variance = _MAX_VARIANCE_FACTOR[profile.modes]
         
         # Time of day variance
-        departure_hour = route.departure_time.hour
-        time_variance = 0
-        if 7 <= departure_hour <= 9 or 17 <= departure_hour <= 19:  # Peak hours
-            time_variance = 5.0  # Higher variance during peak hours
-        elif 22 <= departure_hour or departure_hour <= 5:  # Late night/early morning
-            time_variance = 2.0  # Lower variance during off-peak
-        else:
-            time_variance = 3.0  # Moderate variance during regular hours
+        time_variance = _DEPARTURE_WINDOW_VARIANCE[profile.departure_window]
         
         # Multi-modal coordination variance
         coordination_variance = 0
-        if len(route.transportation_modes) > 1:
+        if profile.mode_count > 1:
             # Each mode change adds coordination uncertainty
-            coordination_variance = (len(route.transportation_modes) - 1) * 2.0
+            coordination_variance = (profile.mode_count - 1) * 2.0
         
         # Weather-related historical variance
         weather_variance = 0
-        weather_conditions = current_conditions.get('weather_data', {})
+        weather_conditions = conditions.weather
         weather_condition = weather_conditions.get('condition', 'clear')
         
-        if weather_condition in ['rain', 'snow', 'fog', 'storm']:
+        if weather_condition in _HIGH_VARIANCE_WEATHER:
             # Bad weather increases historical variance
             weather_variance = 3.0
             # Cycling and walking more affected
-            if any(mode in [TransportationMode.CYCLING, TransportationMode.WALKING] 
-                   for mode in route.transportation_modes):
+            if not _EXPOSED_MODES.isdisjoint(profile.modes):
                 weather_variance *= 1.5
         
         total_variance = (base_variance + complexity_variance + distance_variance + 
@@ -534,7 +776,8 @@ class RouteAnalysisService:
     def _calculate_incident_probability(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> float:
         """
         Calculate real-time incident probability.
@@ -547,54 +790,28 @@ class RouteAnalysisService:
         """
         base_probability = 0.05  # 5% base incident probability
         
-        # Transportation mode incident susceptibility
-        mode_incident_rates = {
-            TransportationMode.WALKING: 0.01,  # Very low incident rate
-            TransportationMode.CYCLING: 0.03,  # Low incident rate
-            TransportationMode.PUBLIC_TRANSIT: 0.08,  # Service disruptions
-            TransportationMode.RIDESHARE: 0.12,  # Traffic + pickup issues
-            TransportationMode.DRIVING: 0.15   # Highest incident rate
-        }
-        
-        # Use maximum incident rate from all modes
-        max_mode_rate = max(mode_incident_rates.get(mode, 0.05) 
-                           for mode in route.transportation_modes)
+        # Transportation mode incident susceptibility: use maximum rate from all modes
+        max_mode_rate = _MAX_INCIDENT_RATE[profile.modes]
         
         # Distance-based incident probability
         distance_factor = min(0.1, route.total_distance * 0.002)  # Longer routes = higher probability
         
         # Time of day incident patterns
-        departure_hour = route.departure_time.hour
-        time_factor = 0
-        if 7 <= departure_hour <= 9 or 17 <= departure_hour <= 19:  # Peak hours
-            time_factor = 0.05  # Higher incident probability during peak
-        elif 22 <= departure_hour or departure_hour <= 5:  # Late night/early morning
-            time_factor = 0.02  # Lower incident probability during off-peak
+        time_factor = _DEPARTURE_WINDOW_INCIDENT_FACTORS[profile.departure_window]
         
         # Current traffic incident reports
-        traffic_data = current_conditions.get('traffic_data', {})
+        traffic_data = conditions.traffic
         active_incidents = traffic_data.get('active_incidents', 0)
         incident_factor = min(0.1, active_incidents * 0.02)  # Each incident adds 2% probability
         
         # Weather-related incident probability
-        weather_conditions = current_conditions.get('weather_data', {})
+        weather_conditions = conditions.weather
         weather_condition = weather_conditions.get('condition', 'clear')
         
-        weather_incident_factors = {
-            'clear': 0.0,
-            'rain': 0.03,
-            'heavy_rain': 0.06,
-            'snow': 0.08,
-            'heavy_snow': 0.12,
-            'fog': 0.05,
-            'storm': 0.10,
-            'ice': 0.15
-        }
-        
-        weather_factor = weather_incident_factors.get(weather_condition, 0.01)
+        weather_factor = _WEATHER_INCIDENT_FACTORS.get(weather_condition, 0.01)
         
         # Route complexity incident factor
-        complexity_factor = len(route.segments) * 0.005  # More segments = more incident points
+        complexity_factor = profile.segment_count * 0.005  # More segments = more incident points
         
         total_probability = (max_mode_rate + distance_factor + time_factor + 
                            incident_factor + weather_factor + complexity_factor)
@@ -604,7 +821,8 @@ class RouteAnalysisService:
     def _calculate_weather_impact(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> float:
         """
         Calculate weather impact on route reliability.
@@ -615,53 +833,29 @@ class RouteAnalysisService:
         - Seasonal weather patterns
         - Weather forecast reliability
         """
-        weather_conditions = current_conditions.get('weather_data', {})
+        weather_conditions = conditions.weather
         weather_condition = weather_conditions.get('condition', 'clear')
         temperature = weather_conditions.get('temperature', 20)  # Celsius
         wind_speed = weather_conditions.get('wind_speed_kmh', 0)  # km/h
         precipitation_probability = weather_conditions.get('precipitation_probability', 0)  # %
         
         # Base weather impact by condition
-        weather_impact_levels = {
-            'clear': 0.0,
-            'cloudy': 0.05,
-            'light_rain': 0.15,
-            'rain': 0.25,
-            'heavy_rain': 0.45,
-            'snow': 0.35,
-            'heavy_snow': 0.60,
-            'fog': 0.30,
-            'storm': 0.55,
-            'ice': 0.70
-        }
-        
-        base_impact = weather_impact_levels.get(weather_condition, 0.1)
-        
-        # Transportation mode weather vulnerability
-        mode_weather_vulnerability = {
-            TransportationMode.PUBLIC_TRANSIT: 0.3,  # Least vulnerable (covered)
-            TransportationMode.RIDESHARE: 0.5,      # Pickup/dropoff exposure
-            TransportationMode.DRIVING: 0.7,        # Road condition dependent
-            TransportationMode.WALKING: 1.2,        # Very vulnerable
-            TransportationMode.CYCLING: 1.5         # Most vulnerable
-        }
-        
-        # Apply maximum vulnerability from route's modes
-        max_vulnerability = max(mode_weather_vulnerability.get(mode, 0.5) 
-                               for mode in route.transportation_modes)
+        base_impact = _WEATHER_IMPACT_LEVELS.get(weather_condition, 0.1)
+        
+        # Transportation mode weather vulnerability: apply maximum from route's modes
+        max_vulnerability = _MAX_WEATHER_VULNERABILITY[profile.modes]
         
         weather_impact = base_impact * max_vulnerability
         
         # Temperature impact on reliability
-        if any(mode in [TransportationMode.WALKING, TransportationMode.CYCLING] 
-               for mode in route.transportation_modes):
+        if not _EXPOSED_MODES.isdisjoint(profile.modes):
             if temperature < -10 or temperature > 40:  # Extreme temperatures
                 weather_impact += 0.2
             elif temperature < 0 or temperature > 35:  # Very hot/cold
                 weather_impact += 0.1
         
         # Wind impact (especially for cycling)
-        if TransportationMode.CYCLING in route.transportation_modes and wind_speed > 25:
+        if TransportationMode.CYCLING in profile.modes and wind_speed > 25:
             weather_impact += min(0.3, (wind_speed - 25) * 0.01)
         
         # Precipitation probability impact
@@ -673,7 +867,8 @@ class RouteAnalysisService:
     def _calculate_service_reliability(
         self, 
         route: Route, 
-        current_conditions: Dict[str, Any]
+        profile: _RouteProfile,
+        conditions: _Conditions
     ) -> float:
         """
         Calculate transit service reliability.
@@ -685,63 +880,37 @@ class RouteAnalysisService:
         - Real-time service updates
         """
         # Non-transit routes have perfect service reliability
-        if TransportationMode.PUBLIC_TRANSIT not in route.transportation_modes:
+        if TransportationMode.PUBLIC_TRANSIT not in profile.modes:
             return 1.0
         
         # Base service reliability
         base_reliability = 0.85  # 85% base reliability for transit
         
         # Current service status
-        transit_data = current_conditions.get('transit_data', {})
+        transit_data = conditions.transit
         service_status = transit_data.get('service_status', 'normal')
         
-        service_reliability_factors = {
-            'normal': 1.0,
-            'minor_delays': 0.9,
-            'delays': 0.75,
-            'major_delays': 0.6,
-            'disrupted': 0.4,
-            'suspended': 0.1,
-            'cancelled': 0.0
-        }
-        
-        status_factor = service_reliability_factors.get(service_status, 0.8)
+        status_factor = _SERVICE_RELIABILITY_FACTORS.get(service_status, 0.8)
         
         # Current delay impact
         current_delay = transit_data.get('delay_minutes', 0)
         delay_factor = max(0.5, 1.0 - (current_delay * 0.02))  # 2% reduction per minute delay
         
         # Time of day service reliability
-        departure_hour = route.departure_time.hour
-        time_reliability = 1.0
-        if 6 <= departure_hour <= 9 or 17 <= departure_hour <= 19:  # Peak hours
-            time_reliability = 0.9  # Slightly less reliable during peak
-        elif 22 <= departure_hour or departure_hour <= 5:  # Late night/early morning
-            time_reliability = 0.7  # Less reliable during off-peak hours
+        time_reliability = _DEPARTURE_WINDOW_SERVICE_RELIABILITY[profile.transit_departure_window]
         
         # Service type reliability (mock - based on route complexity)
         service_type_reliability = 1.0
-        transit_segments = sum(1 for seg in route.segments 
-                              if seg.mode == TransportationMode.PUBLIC_TRANSIT)
+        transit_segments = profile.transit_segments
         if transit_segments > 1:
             # Multiple transit segments = transfers = lower reliability
             service_type_reliability = max(0.6, 1.0 - ((transit_segments - 1) * 0.1))
         
         # Weather impact on service reliability
-        weather_conditions = current_conditions.get('weather_data', {})
+        weather_conditions = conditions.weather
         weather_condition = weather_conditions.get('condition', 'clear')
         
-        weather_service_impact = {
-            'clear': 1.0,
-            'rain': 0.95,
-            'heavy_rain': 0.85,
-            'snow': 0.8,
-            'heavy_snow': 0.6,
-            'storm': 0.7,
-            'ice': 0.5
-        }
-        
-        weather_factor = weather_service_impact.get(weather_condition, 0.9)
+        weather_factor = _WEATHER_SERVICE_IMPACT.get(weather_condition, 0.9)
         
         # Calculate final service reliability
         final_reliability = (base_reliability * status_factor * delay_factor * 
@@ -778,11 +947,12 @@ class RouteAnalysisService:
         
         overall_reliability = sum(score * weight for score, weight in reliability_factors)
         
-        return max(1, min(10, int(overall_reliability)))
+        return _clamp_score(overall_reliability)
     
     def _generate_tradeoff_summary(
         self,
         route: Route,
+        profile: _RouteProfile,
         time_analysis: TimeAnalysis,
         cost_analysis: CostAnalysis,
         stress_analysis: StressAnalysis,
@@ -824,12 +994,12 @@ class RouteAnalysisService:
             when_not_to_choose.append("For important appointments")
         
         # Add mode-specific insights
-        if TransportationMode.CYCLING in route.transportation_modes:
+        if TransportationMode.CYCLING in profile.modes:
             strengths.append("Environmentally friendly")
             strengths.append("Good exercise")
             when_not_to_choose.append("In bad weather")
         
-        if TransportationMode.PUBLIC_TRANSIT in route.transportation_modes:
+        if TransportationMode.PUBLIC_TRANSIT in profile.modes:
             strengths.append("No parking needed")
             when_not_to_choose.append("During service disruptions")
         
@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Set
+from typing import List, Optional, Sequence, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
 
@@ -28,8 +28,8 @@ class RouteRequest:
     destination: Location
     departure_time: datetime
     max_walking_distance: float = 2.0
-    preferred_modes: List[TransportationMode] = None
-    avoided_features: List[str] = None
+    preferred_modes: Sequence[TransportationMode] = None
+    avoided_features: Sequence[str] = None
 
     def __post_init__(self):
         if self.preferred_modes is None:
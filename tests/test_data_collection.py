@@ -0,0 +1,100 @@
+"""Tests for data collection service and real-time data manager."""
+
+import pytest
+from dataclasses import asdict
+from datetime import timedelta
+
+from commute_optimizer.models import Location
+from commute_optimizer.services.data_collection import (
+    DataCollectionService, RealTimeDataManager, DataSource
+)
+
+
+@pytest.fixture
+def data_service():
+    """Data collection service instance."""
+    return DataCollectionService()
+
+
+@pytest.fixture
+def data_manager(data_service):
+    """Real-time data manager instance."""
+    return RealTimeDataManager(data_service)
+
+
+class TestLocationKeys:
+    """Test location key generation and parsing."""
+
+    def test_location_key_round_trip_with_negative_coordinates(self, data_service, data_manager):
+        """Test that keys with negative coordinates parse back to the same locations."""
+        origin = Location(latitude=37.7749, longitude=-122.4194, address="Origin")
+        destination = Location(latitude=-33.8688, longitude=-151.2093, address="Destination")
+
+        key = data_service._generate_location_key(origin, destination)
+        parsed_origin, parsed_destination = data_manager._parse_location_key(key)
+
+        assert parsed_origin.latitude == pytest.approx(37.775)
+        assert parsed_origin.longitude == pytest.approx(-122.419)
+        assert parsed_destination.latitude == pytest.approx(-33.869)
+        assert parsed_destination.longitude == pytest.approx(-151.209)
+
+    def test_parse_invalid_location_key(self, data_manager):
+        """Test that malformed keys are rejected."""
+        assert data_manager._parse_location_key("37.775,-122.419") == (None, None)
+        assert data_manager._parse_location_key("not|a-key") == (None, None)
+
+
+class TestCacheEviction:
+    """Test bounded least-recently-used cache behaviour."""
+
+    def test_cache_evicts_least_recently_used_entry_per_source(self, data_service):
+        """Test that only the overflowing source loses its oldest entry."""
+        data_service.max_entries_per_source = 2
+
+        data_service._cache_data("weather_a", {}, DataSource.WEATHER, "a")
+        data_service._cache_data("traffic_a", {}, DataSource.TRAFFIC, "a")
+        data_service._cache_data("traffic_b", {}, DataSource.TRAFFIC, "b")
+        data_service.cache.move_to_end("traffic_a")  # Mark as recently used
+        data_service._cache_data("traffic_c", {}, DataSource.TRAFFIC, "c")
+
+        assert "weather_a" in data_service.cache
+        assert "traffic_b" not in data_service.cache
+        assert set(data_service.cache) == {"weather_a", "traffic_a", "traffic_c"}
+
+
+class TestDataFreshnessStatus:
+    """Test data freshness status reporting."""
+
+    def test_freshness_status_counts_by_source(self, data_service, data_manager):
+        """Test that every source is reported and entries are bucketed by age."""
+        data_service._cache_data("traffic_a", {}, DataSource.TRAFFIC, "a")
+        data_service._cache_data("traffic_b", {}, DataSource.TRAFFIC, "b")
+        data_service.cache["traffic_b"].timestamp -= timedelta(minutes=12)
+
+        status = data_manager.get_data_freshness_status()
+
+        assert set(status['by_source']) == {source.value for source in DataSource}
+        assert status['by_source']['traffic'] == {'fresh': 1, 'stale': 0, 'critical': 1, 'total': 2}
+        assert status['by_source']['weather']['total'] == 0
+        assert status['freshness_summary'] == {'fresh': 1, 'stale': 0, 'critical': 1}
+
+
+class TestSynchronousGetters:
+    """Test the synchronous cache-backed getters."""
+
+    def test_cached_transit_data_is_a_copy_without_timestamp(self, data_service):
+        """Test that a cache hit returns the public fields and leaves the cache untouched."""
+        origin = Location(latitude=37.7749, longitude=-122.4194, address="Origin")
+        destination = Location(latitude=37.7849, longitude=-122.4094, address="Destination")
+        location_key = data_service._generate_location_key(origin, destination)
+        transit_data = data_service._get_default_transit_data()
+        data_service._cache_data(
+            f"transit_{location_key}", asdict(transit_data), DataSource.TRANSIT, location_key
+        )
+
+        result = data_service.get_transit_data(origin, destination)
+        result['delay_minutes'] = 99
+
+        assert 'last_updated' not in result
+        assert set(result) == set(data_service.get_transit_data())
+        assert data_service.get_transit_data(origin, destination)['delay_minutes'] == transit_data.delay_minutes
@@ -5,7 +5,8 @@ from datetime import datetime, timedelta
 from pydantic import ValidationError
 from commute_optimizer.models import (
     Location, Route, RouteSegment, TransportationMode,
-    PreferenceProfile, UserPreferences
+    PreferenceProfile, UserPreferences, RouteAnalysis, TimeAnalysis,
+    CostAnalysis, StressAnalysis, ReliabilityAnalysis, TradeoffSummary
 )
 
 
@@ -154,4 +155,34 @@ class TestUserPreferences:
                 saved_locations=[],
                 notification_settings=NotificationSettings(),
                 default_profile="NonExistent"  # This profile doesn't exist
-            )
\ No newline at end of file
+            )
+
+
+class TestRouteAnalysis:
+    """Tests for RouteAnalysis model."""
+    
+    def test_metrics(self):
+        """Test that headline metrics are exposed without being serialized."""
+        analysis = RouteAnalysis(
+            route_id="route_1",
+            timestamp=datetime.now(),
+            time_analysis=TimeAnalysis(estimated_time=20, time_range_min=18, time_range_max=25),
+            cost_analysis=CostAnalysis(total_cost=8.50),
+            stress_analysis=StressAnalysis(
+                traffic_stress=7, complexity_stress=4, weather_stress=5, overall_stress=6
+            ),
+            reliability_analysis=ReliabilityAnalysis(
+                historical_variance=5.0,
+                incident_probability=0.15,
+                weather_impact=0.2,
+                service_reliability=0.9,
+                overall_reliability=8
+            ),
+            tradeoff_summary=TradeoffSummary(
+                strengths=[], weaknesses=[], when_to_choose=[],
+                when_not_to_choose=[], compared_to_alternatives=[]
+            )
+        )
+        
+        assert analysis.metrics == (20, 8.50, 6, 8)
+        assert 'metrics' not in analysis.model_dump()
@@ -0,0 +1,82 @@
+"""Tests for route analysis service."""
+
+import logging
+
+import pytest
+
+from commute_optimizer.app import CommuteOptimizerApp
+from commute_optimizer.services.route_analysis import RouteAnalysisService
+
+
+@pytest.fixture
+def analysis_service():
+    """Route analysis service instance."""
+    return RouteAnalysisService()
+
+
+@pytest.fixture
+def conditions():
+    """Current conditions with nested traffic and weather data."""
+    return {
+        'traffic_data': {'congestion_level': 'heavy', 'pattern': 'stop_and_go'},
+        'weather_data': {'condition': 'rain', 'temperature': 8}
+    }
+
+
+class TestBatchAnalysis:
+    """Test analyzing several routes under shared conditions."""
+
+    def test_batch_matches_individual_analyses_in_order(self, analysis_service, sample_route, conditions):
+        """Test that batch results line up with analyzing each route on its own."""
+        routes = [
+            sample_route,
+            sample_route.model_copy(update={'id': 'route_456', 'total_distance': 25.0}),
+        ]
+
+        batch = analysis_service.analyze_routes(routes, conditions)
+        individual = [RouteAnalysisService().analyze_route(route, conditions) for route in routes]
+
+        assert [analysis.route_id for analysis in batch] == ['route_123', 'route_456']
+        assert batch[0].timestamp == batch[1].timestamp
+        assert ([analysis.model_dump(exclude={'timestamp'}) for analysis in batch] ==
+                [analysis.model_dump(exclude={'timestamp'}) for analysis in individual])
+
+
+class TestAppRouteAnalysis:
+    """Test the application's use of batch route analysis."""
+
+    def test_failing_route_is_skipped(self, sample_route, conditions, monkeypatch):
+        """Test that one route failing analysis does not drop the others."""
+        app = CommuteOptimizerApp()
+        failing_route = sample_route.model_copy(update={'id': 'route_bad'})
+        build_analysis = app.route_analysis._build_analysis
+
+        def fail_for_bad_route(route, *args):
+            if route.id == 'route_bad':
+                raise ValueError("analysis failed")
+            return build_analysis(route, *args)
+
+        monkeypatch.setattr(app.route_analysis, '_build_analysis', fail_for_bad_route)
+
+        analyses = app._analyze_routes([failing_route, sample_route], conditions)
+
+        assert [analysis.route_id for analysis in analyses] == ['route_123']
+
+    def test_batch_failure_falls_back_to_individual_analyses(self, sample_route, conditions, monkeypatch, caplog):
+        """Test that a failing batch call is logged and every route is still analyzed on its own."""
+        app = CommuteOptimizerApp()
+        routes = [
+            sample_route,
+            sample_route.model_copy(update={'id': 'route_456', 'total_distance': 25.0}),
+        ]
+
+        def fail_batch(*args, **kwargs):
+            raise RuntimeError("batch failed")
+
+        monkeypatch.setattr(app.route_analysis, 'analyze_routes', fail_batch)
+
+        with caplog.at_level(logging.WARNING, logger='commute_optimizer.app'):
+            analyses = app._analyze_routes(routes, conditions)
+
+        assert [analysis.route_id for analysis in analyses] == ['route_123', 'route_456']
+        assert any("batch failed" in record.getMessage() for record in caplog.records)
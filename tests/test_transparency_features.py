@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime, timedelta
-from commute_optimizer.services.decision_making import DecisionMakingEngine
+from commute_optimizer.services.decision_making import DecisionMakingEngine, clear_language_caches
 from commute_optimizer.models import (
     Route, RouteAnalysis, PreferenceProfile, TransportationMode,
     TimeAnalysis, CostAnalysis, StressAnalysis, ReliabilityAnalysis,
@@ -241,6 +241,86 @@ class TestTransparencyFeatures:
         assert len(budget_warnings) > 0
 
 
+class TestRouteRanking:
+    """Test preference-weighted route ranking."""
+    
+    def test_rank_routes_orders_by_weighted_score(self, decision_engine, sample_routes_and_analyses, sample_preferences):
+        """Test that ranked scores match the per-route weighted score."""
+        routes, analyses = sample_routes_and_analyses
+        
+        ranked = decision_engine.rank_routes(routes, analyses, sample_preferences)
+        
+        scores = [score for _, _, score in ranked]
+        assert scores == sorted(scores, reverse=True)
+        for route, analysis, score in ranked:
+            expected = decision_engine._calculate_weighted_score(route, analysis, sample_preferences)
+            assert score == pytest.approx(expected)
+            assert 0.0 <= score <= 1.0
+    
+    def test_rank_routes_top_k(self, decision_engine, sample_routes_and_analyses, sample_preferences):
+        """Test that top_k returns the head of the full ranking."""
+        routes, analyses = sample_routes_and_analyses
+        
+        full_ranking = decision_engine.rank_routes(routes, analyses, sample_preferences)
+        top_ranking = decision_engine.rank_routes(routes, analyses, sample_preferences, top_k=1)
+        
+        assert top_ranking == full_ranking[:1]
+
+    def test_batch_preference_impact_matches_single_previews(self, decision_engine, sample_routes_and_analyses, sample_preferences):
+        """Test that batched what-if previews match individual impact analyses."""
+        routes, analyses = sample_routes_and_analyses
+        weight_change_list = [
+            {'time_weight': 10, 'cost_weight': 45},
+            {},
+            {'time_weight': 90}  # Invalid: weights no longer sum to 100
+        ]
+
+        batch = decision_engine.batch_preference_impact(routes, analyses, sample_preferences, weight_change_list)
+
+        assert batch == [
+            decision_engine.get_preference_impact_analysis(routes, analyses, sample_preferences, changes)
+            for changes in weight_change_list
+        ]
+        assert batch[1]['valid'] and not batch[1]['ranking_changes']
+        assert not batch[2]['valid']
+
+    def test_preference_impact_reports_first_position_of_repeated_ids(self, decision_engine, sample_routes_and_analyses, sample_preferences):
+        """Test that a route id listed twice reports the position of its first occurrence."""
+        routes, analyses = sample_routes_and_analyses
+        routes, analyses = routes + [routes[0]], analyses + [analyses[0]]
+        changes = {'time_weight': 10, 'cost_weight': 45}
+
+        impact = decision_engine.get_preference_impact_analysis(routes, analyses, sample_preferences, changes)
+        new_order = [
+            route.id for route, _, _ in
+            decision_engine.apply_dynamic_preference_weights(routes, analyses, sample_preferences, changes)
+        ]
+
+        assert impact['ranking_changes']
+        for change in impact['ranking_changes']:
+            assert change['new_position'] == new_order.index(change['route_id']) + 1
+
+    def test_adjusted_preferences_are_validated(self, decision_engine, sample_routes_and_analyses, sample_preferences):
+        """Test that what-if weights are coerced and validated like any preference profile."""
+        routes, analyses = sample_routes_and_analyses
+
+        coerced = decision_engine.get_preference_impact_analysis(
+            routes, analyses, sample_preferences, {'time_weight': '50', 'cost_weight': '5'}
+        )
+        reranked = decision_engine.apply_dynamic_preference_weights(
+            routes, analyses, sample_preferences, {'time_weight': '50', 'cost_weight': '5'}
+        )
+        fractional = decision_engine.get_preference_impact_analysis(
+            routes, analyses, sample_preferences, {'time_weight': 40.5, 'cost_weight': 14.5}
+        )
+
+        assert coerced['valid']
+        assert reranked == decision_engine.apply_dynamic_preference_weights(
+            routes, analyses, sample_preferences, {'time_weight': 50, 'cost_weight': 5}
+        )
+        assert not fractional['valid']
+
+
 class TestLanguageFiltering:
     """Test language filtering and compliance features."""
     
@@ -348,6 +428,30 @@ class TestLanguageFiltering:
             else:
                 assert len(violations) == 0, f"Unexpected violations for: {text}"
 
+    
+    def test_filter_rechecks_terms_against_corrected_text(self, decision_engine):
+        """Test that later terms are checked against text already corrected for earlier ones."""
+        result = decision_engine.filter_and_correct_language("The best route is recommended")
+        
+        # The "best" replacement explains the claim, so "recommended" is left alone
+        assert result["corrected_text"] == (
+            "The highest-scoring based on your preferences route is recommended"
+        )
+        assert [change["original_term"] for change in result["changes_made"]] == ["best"]
+    
+    def test_language_checks_are_memoized(self, decision_engine):
+        """Test that repeated checks reuse cached results without sharing output lists."""
+        clear_language_caches()
+        text = "This is the best route and the fastest option"
+        
+        first = decision_engine._check_forbidden_terms(text)
+        first.clear()
+        second = decision_engine._check_forbidden_terms(text)
+        
+        assert [v["term"] for v in second] == ["best route", "the best"]
+        assert decision_engine.validate_language_compliance(text)["forbidden_terms_found"] == [
+            "best route", "the best"
+        ]
 
 class TestExplanationGeneration:
     """Test explanation generation methods."""
@@ -375,7 +479,37 @@ class TestExplanationGeneration:
         assert len(weaknesses) > 0
         cost_weaknesses = [w for w in weaknesses if "cost" in w.lower() or "expensive" in w.lower()]
         assert len(cost_weaknesses) > 0
-    
+
+    def test_routes_sharing_an_id_are_not_compared(self, decision_engine, sample_routes_and_analyses):
+        """Test that every route with the same id is left out of the comparison."""
+        routes, analyses = sample_routes_and_analyses
+        faster = analyses[0].model_dump()
+        faster['time_analysis']['estimated_time'] = 10
+        duplicated_routes = routes + [routes[0]]
+        duplicated_analyses = analyses + [RouteAnalysis.model_validate(faster)]
+        stats = decision_engine._metric_stats(duplicated_routes, duplicated_analyses)
+
+        expected = decision_engine._identify_route_strengths(routes[0], analyses[0], routes, analyses)
+
+        assert "Fastest option at 20 minutes" in expected
+        assert decision_engine._identify_route_strengths(
+            routes[0], analyses[0], duplicated_routes, duplicated_analyses
+        ) == expected
+        assert decision_engine._identify_route_strengths(
+            routes[0], analyses[0], duplicated_routes, duplicated_analyses, stats
+        ) == expected
+
+    def test_absolute_strengths_include_threshold_values(self, decision_engine, sample_routes_and_analyses):
+        """Test that absolute strength thresholds are inclusive."""
+        routes, analyses = sample_routes_and_analyses
+        route, analysis = routes[0], analyses[0]  # 20 minutes, reliability 8
+
+        strengths = decision_engine._identify_route_strengths(route, analysis, routes, analyses)
+
+        assert "Very quick commute" in strengths
+        assert "Highly predictable" in strengths
+        assert "Very affordable" not in strengths
+
     def test_when_to_choose_guidance(self, decision_engine, sample_routes_and_analyses):
         """Test generation of when-to-choose guidance."""
         routes, analyses = sample_routes_and_analyses
@@ -388,4 +522,16 @@ class TestExplanationGeneration:
         
         # Should include time-related guidance for the fast route
         time_guidance = [g for g in guidance if "time" in g.lower() or "quick" in g.lower()]
-        assert len(time_guidance) > 0
\ No newline at end of file
+        assert len(time_guidance) > 0
+    
+    def test_decision_guidance_picks_earliest_best_route(self, decision_engine, sample_routes_and_analyses):
+        """Test that decision guidance names each criterion's best route, earliest first on ties."""
+        routes, analyses = sample_routes_and_analyses
+        routes, analyses = routes + [routes[1]], analyses + [analyses[1]]
+        
+        guidance = decision_engine._generate_decision_guidance(routes, analyses)
+        
+        assert [g["recommendation"].split(" - ")[0] for g in guidance] == [
+            "Choose Route 1", "Choose Route 2", "Choose Route 2", "Choose Route 1"
+        ]
+        assert guidance[1]["recommendation"].endswith("cheapest at $3.25")